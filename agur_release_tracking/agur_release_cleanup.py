@@ -24,7 +24,7 @@ Features:
     - Scans all 73 AGUR units across 7 chiplets
     - Identifies releases older than configurable threshold (default: 90 days)
     - Detects symlinks and their owners via file ownership
-    - Calculates reclaimable disk space using parallel du commands
+    - Calculates reclaimable disk space using parallel directory walks
     - Generates detailed CSV and HTML reports
     - Sends coordination emails to release owners, symlink owners, and chiplet managers
     - Tracks email history (remembers which releases were emailed)
@@ -52,7 +52,7 @@ Arguments:
     --batch                Disable interactive mode (for automated runs)
     --dry-run              Analysis only, no emails or reports
     --send-emails          Send emails in batch mode
-    --parallel N           Number of parallel du processes (default: 10)
+    --parallel N           Number of parallel scan workers (default: 10)
     --output-dir DIR       Output directory for reports (default: ./cleanup_reports)
     --quiet                Minimal output (summary only)
     --help                 Show this help message
@@ -63,6 +63,7 @@ Output:
     - CSV Report: cleanup_reports/cleanup_report_YYYYMMDD_HHMMSS.csv
     - Emails: To unit owners with CC to symlink owners and chiplet managers
     - Approval State: cleanup_reports/approval_state_YYYYMMDD_HHMMSS.json
+                      (+ .jsonl log of approval toggles since the last snapshot)
     - Log file: logs/release_cleanup_YYYYMMDD.log
 
 Examples:
@@ -89,15 +90,23 @@ import os
 import sys
 import re
 import csv
+import pwd
 import base64
+import copy
+import functools
+import heapq
 import smtplib
-import subprocess
 import argparse
+import queue
 import getpass
 from datetime import datetime, timedelta
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import List, Dict, Set, Optional, Tuple
+from typing import TYPE_CHECKING, List, Dict, Set, FrozenSet, Optional, Tuple
+from operator import attrgetter, itemgetter
+from itertools import groupby, islice
+from collections import OrderedDict
+from bisect import bisect_left
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -105,9 +114,22 @@ import logging
 import json
 import webbrowser
 import time
-from threading import Thread
-from flask import Flask, request, jsonify
-from flask_cors import CORS
+from threading import Thread, Lock, RLock, Event
+from jinja2 import Environment, FileSystemLoader
+from markupsafe import Markup, escape
+
+# Flask is only needed by the approval server - imported there so report-only
+# and batch runs skip its import cost
+if TYPE_CHECKING:
+    from flask import Flask
+
+# orjson is optional - much faster (de)serialization of the approval state and
+# the dashboard chart data
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Chiplet to units mapping
 CHIPLET_UNITS = {
@@ -130,6 +152,9 @@ RELEASE_BASE_PATH = '/home/agur_backend_blockRelease/block/'
 UNITS_TABLE_FILE = SCRIPT_DIR / 'AGUR_UNITS_TABLE.csv'
 DEFAULT_AGE_THRESHOLD = 90  # days
 DEFAULT_PARALLEL_PROCESSES = 10
+BYTES_PER_GB = 1 << 30
+BYTES_PER_TB = 1 << 40
+TEMPLATES_DIR = SCRIPT_DIR / 'templates'
 LOGO_PATH = SCRIPT_DIR.parent / 'assets/images/avice_logo_small.png'
 
 # Chiplet managers mapping
@@ -142,8 +167,23 @@ CHIPLET_MANAGERS = {
     'QNS': 'ohamama@nvidia.com',
     'TCB': 'ohamama@nvidia.com'
 }
+# Backup manager CC'd on these chiplets (temporary - ohamama on vacation)
+BACKUP_MANAGER = 'vliberchuk@nvidia.com'
+BACKUP_MANAGER_CHIPLETS = frozenset({'QNS', 'TCB'})
 PROJECT_MANAGER = 'oberkovitz@nvidia.com'
 ALWAYS_CC = 'avice@nvidia.com'  # Always CC on all emails
+SMTP_HOST = 'localhost'
+# Stop a bulk send once at least this many emails were tried and over a third failed
+EMAIL_ABORT_MIN_ATTEMPTS = 30
+# Cycle the SMTP session after this many messages so the MTA does not throttle or drop it
+MAX_EMAILS_PER_CONNECTION = 500
+# Number of SMTP connections (and sender threads) used for a bulk send
+SMTP_POOL_SIZE = max(1, int(os.environ.get('AGUR_SMTP_POOL_SIZE', '4')))
+
+@functools.lru_cache(maxsize=None)
+def email_of(username: str) -> str:
+    """NVIDIA email address for a username (one interned string per user)"""
+    return sys.intern(f"{username}@nvidia.com")
 
 def get_test_mode_recipient() -> str:
     """Resolve test-mode recipient to the current user."""
@@ -155,10 +195,10 @@ def get_test_mode_recipient() -> str:
         return ALWAYS_CC
     if '@' in username:
         return username
-    return f"{username}@nvidia.com"
+    return email_of(username)
 
-# Data structures
-@dataclass
+# Data structures (slots: one instance per release/symlink, kept for the whole run)
+@dataclass(slots=True)
 class SymlinkInfo:
     """Information about a symlink pointing to a release"""
     symlink_name: str
@@ -166,7 +206,7 @@ class SymlinkInfo:
     symlink_path: str
     target_release: str
     
-@dataclass
+@dataclass(slots=True)
 class ReleaseInfo:
     """Information about a single release directory"""
     unit: str
@@ -185,8 +225,9 @@ class ReleaseInfo:
     log_file_path: str = ''
     folder_owner: str = ''  # Current owner from filesystem (ls -l)
     log_owner: str = ''  # Original release creator from logs/block_release.log
+    release_id: str = field(default='', init=False)  # Cached by get_release_id()
 
-@dataclass
+@dataclass(slots=True)
 class OwnerRecommendation:
     """Cleanup recommendations for a specific owner"""
     owner_email: str
@@ -196,14 +237,42 @@ class OwnerRecommendation:
     unit_count: int
     release_count: int
     chiplet_manager: str
-    all_symlink_owners: Set[str] = field(default_factory=set)
-    cc_log_owners: Set[str] = field(default_factory=set)  # Previous owners from logs for CC
+    needs_backup_manager_cc: bool = False  # Any release in BACKUP_MANAGER_CHIPLETS
+    
+    @property
+    def all_symlink_owners(self) -> FrozenSet[str]:
+        """Owners of symlinks pointing at these releases (other than the release owner)"""
+        return frozenset(email_of(s.symlink_owner)
+                         for r in self.releases
+                         for s in r.symlink_infos
+                         if s.symlink_owner != r.owner)
+    
+    @property
+    def cc_log_owners(self) -> FrozenSet[str]:
+        """Previous owners from logs for CC (when different from the folder owner)"""
+        return frozenset(email_of(r.log_owner)
+                         for r in self.releases
+                         if r.log_owner and r.log_owner != r.folder_owner)
 
 # Global state
 logger = None
+_unit_symlink_entries: Dict[str, List[os.DirEntry]] = {}  # unit -> symlinks seen by scan_unit_releases
+
+def find_mount_point(path: str) -> str:
+    """Walk up from path to the mount point of the filesystem containing it"""
+    path = os.path.realpath(path)
+    while not os.path.ismount(path):
+        parent = os.path.dirname(path)
+        if parent == path:
+            break
+        path = parent
+    return path
 
 def get_actual_disk_usage(path: str) -> Tuple[int, float, float, float]:
-    """Get actual disk usage from df command
+    """Get actual disk usage of the filesystem containing path
+    
+    Results are cached per mount point, so repeated calls for paths on the
+    same filesystem query it only once per run.
     
     Args:
         path: Path to check disk usage for
@@ -212,40 +281,21 @@ def get_actual_disk_usage(path: str) -> Tuple[int, float, float, float]:
         Tuple of (usage_pct, total_capacity_tb, used_tb, available_tb)
         Returns default fallback values if query fails
     """
+    return _get_mount_disk_usage(find_mount_point(path))
+
+@functools.lru_cache(maxsize=16)
+def _get_mount_disk_usage(path: str) -> Tuple[int, float, float, float]:
+    """Get actual disk usage with a single statvfs call (cached per mount point)"""
     try:
-        result = subprocess.run(['df', '-h', path], 
-                                stdout=subprocess.PIPE, 
-                                stderr=subprocess.PIPE,
-                                universal_newlines=True, 
-                                timeout=5)
-        if result.returncode == 0:
-            lines = result.stdout.strip().split('\n')
-            if len(lines) >= 2:
-                parts = lines[1].split()
-                if len(parts) >= 5:
-                    usage_pct = int(parts[4].rstrip('%'))
-                    # Parse sizes (e.g., "120T" -> 120.0)
-                    size_str = parts[1]  # Total
-                    used_str = parts[2]  # Used
-                    avail_str = parts[3] # Available
-                    
-                    # Simple conversion (handles T, G, M suffixes)
-                    def parse_size_tb(s):
-                        s = s.upper()
-                        if s.endswith('T'):
-                            return float(s[:-1])
-                        elif s.endswith('G'):
-                            return float(s[:-1]) / 1024
-                        elif s.endswith('M'):
-                            return float(s[:-1]) / (1024 * 1024)
-                        return 0.0
-                    
-                    total_tb = parse_size_tb(size_str)
-                    used_tb = parse_size_tb(used_str)
-                    avail_tb = parse_size_tb(avail_str)
-                    
-                    return (usage_pct, total_tb, used_tb, avail_tb)
-    except Exception as e:
+        st = os.statvfs(path)
+        total = st.f_frsize * st.f_blocks
+        used = st.f_frsize * (st.f_blocks - st.f_bfree)
+        avail = st.f_frsize * st.f_bavail
+        if total > 0:
+            # Same rounding as df: used / (used + available), rounded up
+            usage_pct = -(-100 * used // (used + avail)) if used + avail else 0
+            return (usage_pct, total / BYTES_PER_TB, used / BYTES_PER_TB, avail / BYTES_PER_TB)
+    except OSError as e:
         if logger:
             logger.warning(f"Failed to get disk usage for {path}: {e}")
     
@@ -298,7 +348,7 @@ def parse_arguments():
     parser.add_argument('-c', '--chiplet', type=str,
                         help='Chiplet name(s) - comma-separated, case-insensitive (CPORT, HPORT, HIOPL, NDQ, QNS, TCB, TOP_YC, ALL)')
     parser.add_argument('--parallel', type=int, default=DEFAULT_PARALLEL_PROCESSES,
-                        help=f'Number of parallel du processes (default: {DEFAULT_PARALLEL_PROCESSES})')
+                        help=f'Number of parallel scan workers (default: {DEFAULT_PARALLEL_PROCESSES})')
     parser.add_argument('--output-dir', type=str, default='cleanup_reports',
                         help='Output directory for reports (default: cleanup_reports)')
     parser.add_argument('--test-mode', action='store_true',
@@ -364,20 +414,20 @@ def parse_release_timestamp(release_dir: str) -> Optional[datetime]:
     
     return None
 
-def is_release_directory(path: Path) -> bool:
-    """Check if a directory looks like a release directory"""
-    name = path.name
+def is_release_directory(entry: os.DirEntry) -> bool:
+    """Check if a directory entry (from os.scandir) looks like a release directory"""
+    name = entry.name
     
-    # Must be a directory
-    if not path.is_dir():
+    # Skip symlinks
+    if entry.is_symlink():
         return False
     
-    # Skip symlinks
-    if path.is_symlink():
+    # Must be a directory
+    if not entry.is_dir(follow_symlinks=False):
         return False
     
     # Must contain logs/block_release.log or match naming pattern
-    has_log = (path / 'logs' / 'block_release.log').exists()
+    has_log = os.path.exists(entry.path + '/logs/block_release.log')
     
     # Match typical release patterns
     matches_pattern = bool(re.match(r'^.*_rbv_.*__\d{4}_\d{1,2}_\d{1,2}_\d{1,2}_\d{1,2}_\d{1,2}$', name) or
@@ -385,6 +435,31 @@ def is_release_directory(path: Path) -> bool:
     
     return has_log or matches_pattern
 
+def walk_unit(unit_path: str) -> Tuple[List[os.DirEntry], List[os.DirEntry]]:
+    """
+    List a unit directory once and split its entries by type.
+    
+    The same directory read feeds the release scan (real directories) and the
+    symlink analysis (symlinks), so each unit directory is listed only once.
+    
+    Args:
+        unit_path: Path to the unit directory
+        
+    Returns:
+        Tuple of (release_candidate_entries, symlink_entries)
+    """
+    dir_entries = []
+    symlink_entries = []
+    
+    with os.scandir(unit_path) as it:
+        for entry in it:
+            if entry.is_symlink():
+                symlink_entries.append(entry)
+            elif entry.is_dir(follow_symlinks=False):
+                dir_entries.append(entry)
+    
+    return dir_entries, symlink_entries
+
 def scan_unit_releases(unit: str, unit_info: Dict, age_threshold_days: int) -> List[ReleaseInfo]:
     """
     Scan a single unit directory for old releases.
@@ -397,9 +472,9 @@ def scan_unit_releases(unit: str, unit_info: Dict, age_threshold_days: int) -> L
     Returns:
         List of ReleaseInfo objects for old releases
     """
-    unit_path = Path(RELEASE_BASE_PATH) / unit
+    unit_path = os.path.join(RELEASE_BASE_PATH, unit)
     
-    if not unit_path.exists():
+    if not os.path.exists(unit_path):
         logger.warning(f"Unit directory not found: {unit_path}")
         return []
     
@@ -413,20 +488,29 @@ def scan_unit_releases(unit: str, unit_info: Dict, age_threshold_days: int) -> L
     logger.debug(f"  [DEBUG] Threshold date: {threshold_date}")
     
     try:
-        # Find all symlinks in the unit directory
-        for item in unit_path.iterdir():
-            logger.debug(f"  [DEBUG] Checking item: {item.name}")
+        dir_entries, symlink_entries = walk_unit(unit_path)
+        # Keep the symlinks from this listing for analyze_unit_symlinks()
+        _unit_symlink_entries[unit] = symlink_entries
+        
+        # Canonical unit path, resolved once: release entries are real
+        # directories (is_release_directory rejects symlinks), so appending the
+        # name gives the same canonical path realpath() would per release
+        real_unit_path = os.path.realpath(unit_path)
+        
+        for entry in dir_entries:
+            name = entry.name
+            logger.debug(f"  [DEBUG] Checking item: {name}")
             
-            if not is_release_directory(item):
+            if not is_release_directory(entry):
                 logger.debug(f"    [DEBUG] Skipped - Not a release directory")
                 continue
             
             logger.debug(f"    [DEBUG] Is release directory: YES")
             
             # Parse timestamp
-            release_timestamp = parse_release_timestamp(item.name)
+            release_timestamp = parse_release_timestamp(name)
             if not release_timestamp:
-                logger.debug(f"    [DEBUG] Skipped - Couldn't parse timestamp from: {item.name}")
+                logger.debug(f"    [DEBUG] Skipped - Couldn't parse timestamp from: {name}")
                 continue
             
             # Check age
@@ -441,31 +525,31 @@ def scan_unit_releases(unit: str, unit_info: Dict, age_threshold_days: int) -> L
             logger.debug(f"    [DEBUG] ✓ INCLUDED - Old enough ({age_days} >= {age_threshold_days})")
             
             # Create ReleaseInfo (size and symlinks will be filled later)
-            # Use resolve() to get canonical path for symlink matching
+            # Canonical path for matching against resolved symlink targets
             release_info = ReleaseInfo(
                 unit=unit,
                 chiplet=unit_info['chiplet'],
-                release_dir=item.name,
-                full_path=str(item.resolve()),
+                release_dir=name,
+                full_path=real_unit_path + '/' + name,
                 age_days=age_days,
                 size_bytes=0,
                 size_human='',
                 owner=unit_info['owner'],
                 release_timestamp=release_timestamp,
                 has_symlinks=False,
-                log_file_path=str(item / 'logs' / 'block_release.log'),
+                log_file_path=entry.path + '/logs/block_release.log',
                 folder_owner='',
                 log_owner=''
             )
             
             # Get folder owner (current owner from filesystem)
-            release_info.folder_owner = get_directory_owner(item)
+            release_info.folder_owner = get_entry_owner(entry)
             logger.debug(f"    [DEBUG] Folder owner: {release_info.folder_owner}")
             
             logger.debug(f"    [DEBUG] Created ReleaseInfo with full_path: {release_info.full_path}")
             
             old_releases.append(release_info)
-            logger.debug(f"  Found old release: {item.name} ({age_days} days old)")
+            logger.debug(f"  Found old release: {name} ({age_days} days old)")
     
     except PermissionError as e:
         logger.error(f"Permission denied accessing {unit_path}: {e}")
@@ -474,118 +558,86 @@ def scan_unit_releases(unit: str, unit_info: Dict, age_threshold_days: int) -> L
     
     return old_releases
 
-def get_symlink_owner(symlink_path: Path) -> str:
-    """
-    Get the owner of a symlink using ls -l.
-    
-    Args:
-        symlink_path: Path to the symlink
-        
-    Returns:
-        Username of the symlink owner
-    """
+@functools.lru_cache(maxsize=None)
+def get_username(uid: int) -> str:
+    """Resolve a numeric uid to a username (cached - the same few users own everything)"""
     try:
-        result = subprocess.run(
-            ['ls', '-l', str(symlink_path)],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        
-        if result.returncode == 0:
-            # ls -l output: lrwxrwxrwx 1 username group ... -> target
-            parts = result.stdout.split()
-            if len(parts) >= 3:
-                return parts[2]  # Third field is the owner
-        
-    except Exception as e:
-        logger.debug(f"Error getting symlink owner for {symlink_path}: {e}")
-    
-    return 'unknown'
+        return pwd.getpwuid(uid).pw_name
+    except KeyError:
+        return str(uid)  # Same as ls -l for uids without a passwd entry
 
-def get_directory_owner(dir_path: Path) -> str:
+def get_entry_owner(entry: os.DirEntry) -> str:
     """
-    Get the owner of a directory using ls -ld.
+    Get the owner of a directory entry without following symlinks.
     
     Args:
-        dir_path: Path to the directory
+        entry: DirEntry from os.scandir (its lstat result is cached on the entry)
         
     Returns:
-        Username of the directory owner
+        Username of the entry owner, or '' if it cannot be determined
     """
     try:
-        result = subprocess.run(
-            ['ls', '-ld', str(dir_path)],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        
-        if result.returncode == 0:
-            # ls -ld output: drwxr-xr-x 10 username group ... dirname
-            parts = result.stdout.split()
-            if len(parts) >= 3:
-                return parts[2]  # Third field is the owner
-        
-    except Exception as e:
-        logger.debug(f"Error getting directory owner for {dir_path}: {e}")
-    
+        return get_username(entry.stat(follow_symlinks=False).st_uid)
+    except OSError as e:
+        logger.debug(f"Error getting owner for {entry.path}: {e}")
     return ''
 
 def analyze_unit_symlinks(unit: str) -> Dict[str, List[SymlinkInfo]]:
     """
     Analyze all symlinks in a unit directory and map them to their targets.
     
+    Reuses the directory listing taken by scan_unit_releases() when available.
+    
     Args:
         unit: Unit name
         
     Returns:
         Dict mapping release_path -> List[SymlinkInfo]
     """
-    unit_path = Path(RELEASE_BASE_PATH) / unit
+    unit_path = os.path.join(RELEASE_BASE_PATH, unit)
     
-    if not unit_path.exists():
+    if not os.path.exists(unit_path):
         return {}
     
     symlink_map = {}
+    debug = logger.isEnabledFor(logging.DEBUG)
     
     logger.debug(f"  [DEBUG] Analyzing symlinks in {unit}...")
     
     try:
-        # Find all symlinks in the unit directory
-        for item in unit_path.iterdir():
-            if not item.is_symlink():
-                continue
-            
+        symlink_entries = _unit_symlink_entries.pop(unit, None)
+        if symlink_entries is None:
+            _, symlink_entries = walk_unit(unit_path)
+        
+        for entry in symlink_entries:
             try:
                 # Resolve the symlink target
-                target = item.resolve()
+                target_str = os.path.realpath(entry.path)
+                target_name = os.path.basename(target_str)
                 
                 # Get symlink owner
-                owner = get_symlink_owner(item)
+                owner = get_entry_owner(entry) or 'unknown'
                 
                 # Create SymlinkInfo
                 symlink_info = SymlinkInfo(
-                    symlink_name=item.name,
+                    symlink_name=entry.name,
                     symlink_owner=owner,
-                    symlink_path=str(item),
-                    target_release=target.name if target.exists() else 'broken'
+                    symlink_path=entry.path,
+                    target_release=target_name if os.path.exists(target_str) else 'broken'
                 )
                 
                 # Map to target path
-                target_str = str(target)
-                if target_str not in symlink_map:
-                    symlink_map[target_str] = []
-                symlink_map[target_str].append(symlink_info)
+                symlink_map.setdefault(target_str, []).append(symlink_info)
                 
-                logger.debug(f"    [DEBUG] Found symlink: {item.name}")
-                logger.debug(f"      Symlink path: {str(item)}")
-                logger.debug(f"      Target (resolved): {target_str}")
-                logger.debug(f"      Target name: {target.name}")
-                logger.debug(f"      Owner: {owner}")
+                if debug:
+                    logger.debug(f"    [DEBUG] Found symlink: {entry.name}")
+                    logger.debug(f"      Symlink path: {entry.path}")
+                    logger.debug(f"      Target (resolved): {target_str}")
+                    logger.debug(f"      Target name: {target_name}")
+                    logger.debug(f"      Owner: {owner}")
                 
             except Exception as e:
-                logger.debug(f"  Error resolving symlink {item}: {e}")
+                logger.debug(f"  Error resolving symlink {entry.path}: {e}")
     
     except PermissionError as e:
         logger.error(f"Permission denied accessing symlinks in {unit_path}: {e}")
@@ -596,7 +648,10 @@ def analyze_unit_symlinks(unit: str) -> Dict[str, List[SymlinkInfo]]:
 
 def calculate_directory_size(path: str) -> Tuple[int, str]:
     """
-    Calculate directory size using du command.
+    Calculate directory disk usage with a single os.scandir walk.
+    
+    Sums allocated blocks (st_blocks * 512) like du does, without following
+    symlinks and counting hard-linked files once.
     
     Args:
         path: Directory path
@@ -605,63 +660,107 @@ def calculate_directory_size(path: str) -> Tuple[int, str]:
         Tuple of (size_bytes, human_readable_size)
     """
     try:
-        # Use du -sb for bytes, du -sh for human readable
-        result_bytes = subprocess.run(
-            ['du', '-sb', path],
-            capture_output=True,
-            text=True,
-            timeout=300  # 5 minute timeout per directory
-        )
-        
-        result_human = subprocess.run(
-            ['du', '-sh', path],
-            capture_output=True,
-            text=True,
-            timeout=300
-        )
-        
-        size_bytes = 0
-        size_human = '0'
-        
-        if result_bytes.returncode == 0:
-            parts = result_bytes.stdout.split()
-            if parts:
-                size_bytes = int(parts[0])
-        
-        if result_human.returncode == 0:
-            parts = result_human.stdout.split()
-            if parts:
-                size_human = parts[0]
-        
-        return size_bytes, size_human
-        
-    except subprocess.TimeoutExpired:
-        logger.warning(f"Timeout calculating size for {path}")
-        return 0, 'timeout'
-    except Exception as e:
+        size_bytes = os.lstat(path).st_blocks * 512
+    except OSError as e:
         logger.debug(f"Error calculating size for {path}: {e}")
         return 0, 'error'
+    
+    seen_inodes = set()
+    pending = [path]
+    
+    while pending:
+        current = pending.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    try:
+                        st = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    
+                    if st.st_nlink > 1 and not entry.is_dir(follow_symlinks=False):
+                        inode_key = (st.st_dev, st.st_ino)
+                        if inode_key in seen_inodes:
+                            continue
+                        seen_inodes.add(inode_key)
+                    
+                    size_bytes += st.st_blocks * 512
+                    
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+        except OSError as e:
+            # Unreadable subdirectory - count what we can, like du does
+            logger.debug(f"Error reading {current}: {e}")
+    
+    return size_bytes, format_bytes(size_bytes)
+
+def extract_owner_from_log(log_file_path: str) -> Optional[str]:
+    """
+    Extract owner from block_release.log file.
+    
+    Looks for line like: "-I- [timestamp] USER: username"
+    
+    Args:
+        log_file_path: Path to block_release.log
+        
+    Returns:
+        Username or None if not found
+    """
+    if not os.path.exists(log_file_path):
+        return None
+    
+    try:
+        with open(log_file_path, 'r', errors='ignore') as f:
+            for line in f:
+                if 'USER:' in line:
+                    # Format: -I- [timestamp] USER: username
+                    match = re.search(r'USER:\s+(\w+)', line)
+                    if match:
+                        return match.group(1)
+                    break  # USER line is usually near the top
+    except Exception as e:
+        logger.debug(f"Error reading log file {log_file_path}: {e}")
+    
+    return None
 
-def calculate_sizes_parallel(releases: List[ReleaseInfo], max_workers: int = 10) -> List[ReleaseInfo]:
+def enrich_releases_parallel(releases: List[ReleaseInfo], max_workers: int = 10,
+                             want_log_owner: bool = True) -> List[ReleaseInfo]:
     """
-    Calculate disk usage for all releases using parallel du commands.
+    Calculate disk usage and extract log owners for all releases in one parallel pass.
+    
+    Each task sizes a release and then reads its logs/block_release.log, so the
+    log is opened while that release directory is still warm in the VFS cache
+    and the release list is swept once instead of twice. Owners are resolved
+    afterwards (see resolve_release_owners).
     
     Args:
         releases: List of ReleaseInfo objects
-        max_workers: Number of parallel processes
+        max_workers: Number of parallel workers
+        want_log_owner: If False, only read logs of releases without a folder owner
+                        (log_owner is only needed for CC'ing, i.e. when emails may be sent)
         
     Returns:
-        Updated list with size information
+        Updated list with size and owner information
     """
-    logger.info(f"\nCalculating disk usage (parallel={max_workers})...")
+    logger.info(f"\nCalculating disk usage and extracting log owners (parallel={max_workers})...")
     
     total_bytes = 0
     completed = 0
+    log_owner_count = 0
+    
+    def enrich_one(release: ReleaseInfo) -> Tuple[int, str, Optional[str]]:
+        size_bytes, size_human = calculate_directory_size(release.full_path)
+        # Extract log owner (original release creator) - skip the read when
+        # the folder owner wins and nobody needs the log owner for CC
+        log_owner = None
+        if want_log_owner or not release.folder_owner:
+            log_owner = extract_owner_from_log(release.log_file_path)
+        return size_bytes, size_human, log_owner
     
     with ThreadPoolExecutor(max_workers=max_workers) as executor:
         # Submit all tasks
         future_to_release = {
-            executor.submit(calculate_directory_size, release.full_path): release
+            executor.submit(enrich_one, release): release
             for release in releases
         }
         
@@ -669,9 +768,12 @@ def calculate_sizes_parallel(releases: List[ReleaseInfo], max_workers: int = 10)
         for future in as_completed(future_to_release):
             release = future_to_release[future]
             try:
-                size_bytes, size_human = future.result()
+                size_bytes, size_human, log_owner = future.result()
                 release.size_bytes = size_bytes
                 release.size_human = size_human
+                if log_owner:
+                    release.log_owner = log_owner
+                    log_owner_count += 1
                 total_bytes += size_bytes
                 completed += 1
                 
@@ -688,107 +790,72 @@ def calculate_sizes_parallel(releases: List[ReleaseInfo], max_workers: int = 10)
     # Convert total to human readable
     total_human = format_bytes(total_bytes)
     logger.info(f"  Total reclaimable space: {total_human}")
+    if log_owner_count > 0:
+        logger.info(f"  Extracted {log_owner_count} log owners (release creators)")
     
-    return releases
-
-def extract_owner_from_log(log_file_path: str) -> Optional[str]:
-    """
-    Extract owner from block_release.log file.
-    
-    Looks for line like: "-I- [timestamp] USER: username"
-    
-    Args:
-        log_file_path: Path to block_release.log
-        
-    Returns:
-        Username or None if not found
-    """
-    if not os.path.exists(log_file_path):
-        return None
-    
-    try:
-        with open(log_file_path, 'r', errors='ignore') as f:
-            for line in f:
-                if 'USER:' in line:
-                    # Format: -I- [timestamp] USER: username
-                    match = re.search(r'USER:\s+(\w+)', line)
-                    if match:
-                        return match.group(1)
-                    break  # USER line is usually near the top
-    except Exception as e:
-        logger.debug(f"Error reading log file {log_file_path}: {e}")
-    
-    return None
+    return resolve_release_owners(releases)
 
-def enrich_releases_with_log_data(releases: List[ReleaseInfo]) -> List[ReleaseInfo]:
+def resolve_release_owners(releases: List[ReleaseInfo]) -> List[ReleaseInfo]:
     """
-    Extract owner information from block_release.log files.
+    Set each release's owner from the folder owner (priority) or log owner.
     
-    Sets log_owner field and updates owner to folder_owner (priority).
     This ensures emails go to current owner (folder_owner) with previous owner (log_owner) CC'd.
     
     Args:
-        releases: List of ReleaseInfo objects
+        releases: List of ReleaseInfo objects with folder_owner/log_owner filled in
         
     Returns:
-        Updated list with owner information from logs
+        Updated list with resolved owners
     """
-    logger.info("\nExtracting owner information from logs...")
-    
-    log_owner_count = 0
     folder_owner_count = 0
     
     for release in releases:
-        # Extract log owner (original release creator)
-        log_owner = extract_owner_from_log(release.log_file_path)
-        if log_owner:
-            release.log_owner = log_owner
-            log_owner_count += 1
-        
         # Set primary owner to folder owner (current owner) - PRIORITY
         if release.folder_owner:
             if release.folder_owner != release.owner:
                 logger.debug(f"  {release.release_dir}: Owner {release.owner} -> {release.folder_owner} (folder owner)")
                 folder_owner_count += 1
             release.owner = release.folder_owner
-        elif log_owner:
+            release.release_id = ''  # ID embeds the owner - rebuild on next use
+        elif release.log_owner:
             # Fallback to log owner if no folder owner detected
-            if log_owner != release.owner:
-                logger.debug(f"  {release.release_dir}: Owner {release.owner} -> {log_owner} (log owner)")
-            release.owner = log_owner
+            if release.log_owner != release.owner:
+                logger.debug(f"  {release.release_dir}: Owner {release.owner} -> {release.log_owner} (log owner)")
+            release.owner = release.log_owner
+            release.release_id = ''
         # else: keep default owner from AGUR_UNITS_TABLE.csv
     
-    if log_owner_count > 0:
-        logger.info(f"  Extracted {log_owner_count} log owners (release creators)")
     if folder_owner_count > 0:
         logger.info(f"  Updated {folder_owner_count} owners to folder owner (current owner)")
     
     return releases
 
+# Size sort keys for releases / owner recommendations (C-level attrgetter, built once)
+_SIZE_KEY = attrgetter('size_bytes')
+_OWNER_SIZE_KEY = attrgetter('total_size_bytes')
+
+# CSV recommendation text keyed by (requires_coordination, has_symlinks)
+_CSV_RECOMMENDATION = {
+    (True, True): 'Coordinate with symlink owners first',
+    (True, False): 'Coordinate with symlink owners first',
+    (False, True): 'Remove symlinks first',
+    (False, False): 'Safe to delete',
+}
+
 def generate_csv_report(releases: List[ReleaseInfo], output_file: Path):
     """Generate detailed CSV report of all old releases"""
     logger.info(f"  Writing CSV report: {output_file}")
     
-    with open(output_file, 'w', newline='') as f:
-        writer = csv.writer(f)
-        writer.writerow([
-            'Unit', 'Chiplet', 'Release Directory', 'Age (days)', 'Size', 
-            'Owner', 'Release Timestamp', 'Has Symlinks', 'Symlink Names', 
-            'Symlink Owners', 'Requires Coordination', 'Recommendation'
-        ])
-        
-        for release in sorted(releases, key=lambda r: r.size_bytes, reverse=True):
-            symlink_names = ','.join(s.symlink_name for s in release.symlink_infos) if release.symlink_infos else 'None'
-            symlink_owners = ','.join(set(s.symlink_owner for s in release.symlink_infos)) if release.symlink_infos else 'None'
-            
-            if release.requires_coordination:
-                recommendation = 'Coordinate with symlink owners first'
-            elif release.has_symlinks:
-                recommendation = 'Remove symlinks first'
+    def rows():
+        for release in sorted(releases, key=_SIZE_KEY, reverse=True):
+            symlink_infos = release.symlink_infos
+            if symlink_infos:
+                symlink_names = ','.join(s.symlink_name for s in symlink_infos)
+                symlink_owners = ','.join(dict.fromkeys(s.symlink_owner for s in symlink_infos))
             else:
-                recommendation = 'Safe to delete'
+                symlink_names = symlink_owners = 'None'
             
-            writer.writerow([
+            yield (
                 release.unit,
                 release.chiplet,
                 release.release_dir,
@@ -800,11 +867,122 @@ def generate_csv_report(releases: List[ReleaseInfo], output_file: Path):
                 symlink_names,
                 symlink_owners,
                 'Yes' if release.requires_coordination else 'No',
-                recommendation
-            ])
+                _CSV_RECOMMENDATION[release.requires_coordination, release.has_symlinks]
+            )
+    
+    with open(output_file, 'w', newline='', buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        writer.writerow([
+            'Unit', 'Chiplet', 'Release Directory', 'Age (days)', 'Size', 
+            'Owner', 'Release Timestamp', 'Has Symlinks', 'Symlink Names', 
+            'Symlink Owners', 'Requires Coordination', 'Recommendation'
+        ])
+        writer.writerows(rows())
+
+# Dashboard table rows - one %-format string per table, applied to a tuple per
+# row in column order (render_rows escapes every field first)
+_DASHBOARD_ROW_TEMPLATES = {
+    'release_rows': '''            <tr data-release-id="%s" data-chiplet="%s"%s>
+                <td style="padding: 10px; border-bottom: 1px solid #dee2e6; text-align: center;">
+                    <input type="checkbox" class="approval-checkbox" data-release-id="%s" />
+                </td>
+                <td style="padding: 10px; border-bottom: 1px solid #dee2e6; font-weight: bold;">%s%s</td>
+                <td style="padding: 10px; border-bottom: 1px solid #dee2e6;">%s</td>
+                <td style="padding: 10px; border-bottom: 1px solid #dee2e6; font-family: monospace; font-size: 11px; max-width: 400px; word-break: break-all;">%s</td>
+                <td style="padding: 10px; border-bottom: 1px solid #dee2e6; text-align: center;">%sd</td>
+                <td style="padding: 10px; border-bottom: 1px solid #dee2e6; font-size: 12px; max-width: 250px; word-break: break-all;">%s</td>
+                <td style="padding: 10px; border-bottom: 1px solid #dee2e6; text-align: right; font-weight: bold;">%s</td>
+            </tr>
+''',
+    'unit_rows': '''            <tr>
+                <td style="padding: 8px; border-bottom: 1px solid #eee;">%s</td>
+                <td style="padding: 8px; border-bottom: 1px solid #eee;">%s</td>
+                <td style="padding: 8px; border-bottom: 1px solid #eee; text-align: center;">%s</td>
+                <td style="padding: 8px; border-bottom: 1px solid #eee; text-align: right; font-weight: bold;">%s</td>
+            </tr>
+''',
+    'owner_rows': '''        <tr>
+            <td style="padding: 10px; border-bottom: 1px solid #dee2e6; font-weight: bold;">%s</td>
+            <td style="padding: 10px; border-bottom: 1px solid #dee2e6;">%s</td>
+            <td style="padding: 10px; border-bottom: 1px solid #dee2e6;">%s</td>
+            <td style="padding: 10px; border-bottom: 1px solid #dee2e6; text-align: center;">%s</td>
+            <td style="padding: 10px; border-bottom: 1px solid #dee2e6; text-align: right; font-weight: bold;">%s</td>
+        </tr>
+''',
+    'top_consumer_rows': '''                    <tr>
+                        <td style="font-weight: bold;">%s</td>
+                        <td>%s</td>
+                        <td>%s</td>
+                        <td style="text-align: center;">%s</td>
+                        <td style="text-align: right; font-weight: bold; color: #dc3545;">%s</td>
+                    </tr>
+''',
+}
+
+# Release row column order: (release_id, chiplet, row_attrs, release_id, unit,
+# emailed_badge, owner, release_dir, age_days, symlinks_html, size_human)
+_EMAILED_ROW_ATTRS = Markup(' class="emailed-release"')
 
-def generate_dashboard_report(releases: List[ReleaseInfo], output_file: Path):
-    """Generate interactive multi-tab dashboard HTML report with Chart.js visualizations"""
+# Sort/group keys for the dashboard tables (C-level attrgetter, built once)
+_DASHBOARD_ORDER_KEY = attrgetter('chiplet', 'unit', 'release_timestamp')
+_CHIPLET_KEY = attrgetter('chiplet')
+_UNIT_KEY = attrgetter('unit')
+
+# Symlinks cell of a release row (Markup.format escapes the arguments)
+_SYMLINK_ITEM_HTML = Markup("{} <span style='color: #666;'>({})</span>")
+_SYMLINK_SEPARATOR_HTML = Markup('<br/>')
+_NO_SYMLINKS_HTML = Markup('<span style="color: #999;">None</span>')
+
+@functools.lru_cache(maxsize=None)
+def emailed_badge_html(email_count: int, is_test_mode: bool) -> Markup:
+    """Email count badge (e.g., "✉ 3x") - one cached string per (count, test_mode)"""
+    if email_count <= 0:
+        return Markup('')
+    css_class = 'emailed-badge-test' if is_test_mode else 'emailed-badge'
+    return Markup(f'<span class="{css_class}">✉ {email_count}x</span>')
+
+_jinja_env = Environment(loader=FileSystemLoader(str(TEMPLATES_DIR)), autoescape=True,
+                         trim_blocks=True, lstrip_blocks=True)
+
+@functools.cache
+def _get_template(name: str):
+    """Load and compile a template from TEMPLATES_DIR once per process"""
+    return _jinja_env.get_template(name)
+
+def render_rows(name: str, rows: List[Tuple]) -> str:
+    """Render a list of row tuples with the named dashboard row template"""
+    row_format = _DASHBOARD_ROW_TEMPLATES[name]
+    return ''.join([row_format % tuple(map(escape, row)) for row in rows])
+
+def chart_json(charts: Dict[str, Tuple[List, List]]) -> str:
+    """
+    Serialize all Chart.js datasets for the page's application/json data block.
+    
+    Args:
+        charts: Chart name -> (labels, data) with data in the same order as labels
+        
+    Returns:
+        Compact JSON object string: name -> {'labels': [...], 'data': [...]}
+    """
+    charts_data = {name: {'labels': labels, 'data': data} for name, (labels, data) in charts.items()}
+    if ORJSON_AVAILABLE:
+        # Same compact, non-ASCII-preserving output as the json fallback
+        payload = orjson.dumps(charts_data).decode('utf-8')
+    else:
+        payload = json.dumps(charts_data, ensure_ascii=False, separators=(',', ':'))
+    # Never let a label close the surrounding <script> element
+    return payload.replace('</', '<\\/')
+
+def generate_dashboard_report(releases: List[ReleaseInfo], output_file: Path,
+                              stats: Optional[Dict] = None):
+    """
+    Generate interactive multi-tab dashboard HTML report with Chart.js visualizations
+    
+    Args:
+        releases: List of ReleaseInfo objects
+        output_file: Path of the HTML file to write
+        stats: Precomputed calculate_release_stats(releases, 10) result, computed here if None
+    """
     logger.info(f"  Writing Dashboard report: {output_file}")
     
     # Load approval state to check which releases have been emailed
@@ -812,1190 +990,286 @@ def generate_dashboard_report(releases: List[ReleaseInfo], output_file: Path):
     state = load_approval_state(output_dir)
     emailed_releases = state.get('emailed_releases', {})
     
-    # Calculate all metrics
-    age_dist = calculate_age_distribution(releases)
-    chiplet_breakdown = calculate_chiplet_breakdown(releases)
-    coord_stats = calculate_coordination_stats(releases)
-    top_consumers = get_top_consumers(releases, 10)
-    chiplet_groups = group_by_chiplet_detailed(releases)
-    owner_groups = group_by_owner_detailed(releases)
-    
-    # Calculate totals
+    # Badge per emailed release, computed once: the email count (e.g., "✉ 3x")
+    # styled by the test_mode of the most recent email
+    email_badges = {}
+    for emailed_id, emailed_info in emailed_releases.items():
+        email_history = emailed_info.get('email_history', [])
+        email_badges[emailed_id] = emailed_badge_html(
+            len(email_history), bool(email_history) and email_history[-1].get('test_mode', False))
+    
+    # Calculate all metrics (shared with the other reports when called from generate_reports)
+    if stats is None:
+        stats = calculate_release_stats(releases, 10)
+    age_dist = stats['age_distribution']
+    chiplet_breakdown = stats['chiplet_breakdown']
+    unit_breakdown = stats['unit_breakdown']
+    coord_stats = stats['coordination']
+    top_consumers = stats['top_consumers']
+    unit_owner_summary = stats['unit_owner_summary']
+    owner_groups = stats['owner_groups']
+    
+    # Calculate totals (from the per-chiplet totals - no extra pass over releases)
     total_releases = len(releases)
-    total_size_bytes = sum(r.size_bytes for r in releases)
+    total_size_bytes = sum(c['size_bytes'] for c in chiplet_breakdown.values())
     total_size_human = format_bytes(total_size_bytes)
     
     # Calculate disk utilization - GET ACTUAL VALUES DYNAMICALLY
     usage_pct, total_capacity_tb, current_used_tb, _ = get_actual_disk_usage(RELEASE_BASE_PATH)
     current_utilization = usage_pct
-    freed_tb = total_size_bytes / (1024**4)
+    freed_tb = total_size_bytes / BYTES_PER_TB
     new_used_tb = current_used_tb - freed_tb
     new_utilization = (new_used_tb / total_capacity_tb) * 100
     
-    # Prepare data for Chart.js
-    import json
-    age_labels = list(age_dist.keys())
-    age_values = list(age_dist.values())
+    # Prepare data for Chart.js (one JSON block, parsed once by the page)
+    chart_data_json = chart_json({
+        'age': (list(age_dist), list(age_dist.values())),
+        'chiplet': (list(chiplet_breakdown),
+                    [c['size_bytes'] / BYTES_PER_GB for c in chiplet_breakdown.values()]),  # GB
+    })
     
-    chiplet_labels = list(chiplet_breakdown.keys())
-    chiplet_sizes = [chiplet_breakdown[c]['size_bytes']/(1024**3) for c in chiplet_labels]  # GB
-    chiplet_counts = [chiplet_breakdown[c]['count'] for c in chiplet_labels]
-    
-    # Build per-unit-per-owner summary for "By Unit" tab
-    unit_owner_summary = {}
-    for release in releases:
-        key = (release.unit, release.owner)
-        if key not in unit_owner_summary:
-            unit_owner_summary[key] = {
-                'unit': release.unit,
-                'chiplet': release.chiplet,
-                'owner': release.owner,
-                'count': 0,
-                'size_bytes': 0,
-                'symlinks': {},
-                'release_dirs': []
-            }
-        unit_owner_summary[key]['count'] += 1
-        unit_owner_summary[key]['size_bytes'] += release.size_bytes
-        unit_owner_summary[key]['release_dirs'].append(release.release_dir)
-        for sym in release.symlink_infos:
-            unit_owner_summary[key]['symlinks'][sym.symlink_name] = sym.symlink_owner
+    # Sort once for both chiplet tabs - each slices its chiplet/unit groups from this order
+    releases_sorted = sorted(releases, key=_DASHBOARD_ORDER_KEY)
     
     # Build unit table by chiplet (expandable sections) for "By Unit" tab with per-release checkboxes
-    unit_by_chiplet_sections = ''
-    
-    # Group releases by chiplet
-    chiplet_releases_map = {}
-    for release in releases:
-        if release.chiplet not in chiplet_releases_map:
-            chiplet_releases_map[release.chiplet] = []
-        chiplet_releases_map[release.chiplet].append(release)
+    unit_by_chiplet_parts = []
     
     # Build sections for each chiplet
-    for chiplet_name in sorted(chiplet_releases_map.keys()):
-        chiplet_releases = chiplet_releases_map[chiplet_name]
-        chiplet_total_size = sum(r.size_bytes for r in chiplet_releases)
-        chiplet_count = len(chiplet_releases)
+    for chiplet_name, chiplet_releases in groupby(releases_sorted, key=_CHIPLET_KEY):
+        chiplet_total_size = chiplet_breakdown[chiplet_name]['size_bytes']
+        chiplet_count = chiplet_breakdown[chiplet_name]['count']
+        chiplet_html = escape(chiplet_name)
         
         # Build table rows for this chiplet - ONE ROW PER RELEASE
-        chiplet_unit_rows = ''
-        for release in sorted(chiplet_releases, key=lambda x: (x.unit, x.release_timestamp)):
+        release_rows = []
+        for release in chiplet_releases:
             release_id = get_release_id(release)
             
-            # Check if this release has been emailed
-            is_emailed = release_id in emailed_releases
-            row_class = ' class="emailed-release"' if is_emailed else ''
-            
-            # Determine badge based on email history
-            emailed_badge = ''
-            if is_emailed:
-                emailed_info = emailed_releases[release_id]
-                email_history = emailed_info.get('email_history', [])
-                email_count = len(email_history)
-                
-                if email_count > 0:
-                    # Get test_mode from most recent email
-                    last_email = email_history[-1]
-                    is_test_mode = last_email.get('test_mode', False)
-                    
-                    # Show count badge (e.g., "✉ 3x")
-                    if is_test_mode:
-                        emailed_badge = f'<span class="emailed-badge-test">✉ {email_count}x</span>'
-                    else:
-                        emailed_badge = f'<span class="emailed-badge">✉ {email_count}x</span>'
+            # Check if this release has been emailed (one lookup per row)
+            emailed_badge = email_badges.get(release_id)
+            if emailed_badge is None:
+                emailed_badge = row_attrs = ''
+            else:
+                row_attrs = _EMAILED_ROW_ATTRS
             
-            # Format symlinks for this specific release
-            symlinks_list = []
-            for sym in release.symlink_infos:
-                symlinks_list.append(f"{sym.symlink_name} <span style='color: #666;'>({sym.symlink_owner})</span>")
-            symlinks_html = '<br/>'.join(symlinks_list) if symlinks_list else '<span style="color: #999;">None</span>'
+            symlinks_html = _SYMLINK_SEPARATOR_HTML.join(
+                [_SYMLINK_ITEM_HTML.format(sym.symlink_name, sym.symlink_owner) for sym in release.symlink_infos]
+            ) or _NO_SYMLINKS_HTML
             
-            chiplet_unit_rows += f'''
-            <tr data-release-id="{release_id}" data-chiplet="{release.chiplet}"{row_class}>
-                <td style="padding: 10px; border-bottom: 1px solid #dee2e6; text-align: center;">
-                    <input type="checkbox" class="approval-checkbox" data-release-id="{release_id}" />
-                </td>
-                <td style="padding: 10px; border-bottom: 1px solid #dee2e6; font-weight: bold;">{release.unit}{emailed_badge}</td>
-                <td style="padding: 10px; border-bottom: 1px solid #dee2e6;">{release.owner}</td>
-                <td style="padding: 10px; border-bottom: 1px solid #dee2e6; font-family: monospace; font-size: 11px; max-width: 400px; word-break: break-all;">{release.release_dir}</td>
-                <td style="padding: 10px; border-bottom: 1px solid #dee2e6; text-align: center;">{release.age_days}d</td>
-                <td style="padding: 10px; border-bottom: 1px solid #dee2e6; font-size: 12px; max-width: 250px; word-break: break-all;">{symlinks_html}</td>
-                <td style="padding: 10px; border-bottom: 1px solid #dee2e6; text-align: right; font-weight: bold;">{release.size_human}</td>
-            </tr>'''
+            release_rows.append((release_id, release.chiplet, row_attrs, release_id, release.unit,
+                                 emailed_badge, release.owner, release.release_dir, release.age_days,
+                                 symlinks_html, release.size_human))
+        chiplet_unit_rows = render_rows('release_rows', release_rows)
         
         # Build chiplet section
-        unit_by_chiplet_sections += f'''
+        unit_by_chiplet_parts.append(f'''
         <div class="chiplet-section">
-            <div class="chiplet-header" onclick="toggleChiplet('unit-{chiplet_name}')">
-                <span class="toggle-icon" id="icon-unit-{chiplet_name}">▼</span>
-                <strong>{chiplet_name}</strong>
+            <div class="chiplet-header" onclick="toggleChiplet('unit-{chiplet_html}')">
+                <span class="toggle-icon" id="icon-unit-{chiplet_html}">▼</span>
+                <strong>{chiplet_html}</strong>
                 <span style="margin-left: 20px; color: #666;">
                     {chiplet_count} releases | {format_bytes(chiplet_total_size)}
                 </span>
             </div>
-            <div class="chiplet-content" id="content-unit-{chiplet_name}">
-                <table style="width: 100%; border-collapse: collapse;">
-                    <thead>
-                        <tr style="background-color: #f8f9fa;">
-                            <th style="padding: 10px; text-align: center; border-bottom: 2px solid #dee2e6; width: 50px;">Approve</th>
-                            <th style="padding: 10px; text-align: left; border-bottom: 2px solid #dee2e6;">Unit</th>
-                            <th style="padding: 10px; text-align: left; border-bottom: 2px solid #dee2e6;">Owner</th>
-                            <th style="padding: 10px; text-align: left; border-bottom: 2px solid #dee2e6;">Release Directory</th>
-                            <th style="padding: 10px; text-align: center; border-bottom: 2px solid #dee2e6;">Age</th>
-                            <th style="padding: 10px; text-align: left; border-bottom: 2px solid #dee2e6;">Symlinks (User)</th>
-                            <th style="padding: 10px; text-align: right; border-bottom: 2px solid #dee2e6;">Size</th>
-                        </tr>
-                    </thead>
+            <div class="chiplet-content" id="content-unit-{chiplet_html}">
+                <table style="width: 100%; border-collapse: collapse;" data-thead="unit-thead-tpl">
                     <tbody>
                         {chiplet_unit_rows}
                     </tbody>
                 </table>
             </div>
-        </div>'''
+        </div>''')
     
     # Build chiplet sections HTML for "By Chiplet" tab
-    chiplet_sections = ''
-    for chiplet_name in sorted(chiplet_groups.keys()):
-        chiplet_releases = chiplet_groups[chiplet_name]
-        chiplet_total_size = sum(r.size_bytes for r in chiplet_releases)
-        chiplet_count = len(chiplet_releases)
-        
-        # Group by unit within chiplet
-        unit_map = {}
-        for r in chiplet_releases:
-            if r.unit not in unit_map:
-                unit_map[r.unit] = []
-            unit_map[r.unit].append(r)
-        
-        unit_rows = ''
-        for unit_name in sorted(unit_map.keys()):
-            unit_releases = unit_map[unit_name]
-            unit_size = sum(r.size_bytes for r in unit_releases)
-            unit_count = len(unit_releases)
-            owners = ', '.join(sorted(set(r.owner for r in unit_releases)))
-            
-            unit_rows += f'''
-            <tr>
-                <td style="padding: 8px; border-bottom: 1px solid #eee;">{unit_name}</td>
-                <td style="padding: 8px; border-bottom: 1px solid #eee;">{owners}</td>
-                <td style="padding: 8px; border-bottom: 1px solid #eee; text-align: center;">{unit_count}</td>
-                <td style="padding: 8px; border-bottom: 1px solid #eee; text-align: right; font-weight: bold;">{format_bytes(unit_size)}</td>
-            </tr>'''
-        
-        chiplet_sections += f'''
+    chiplet_section_parts = []
+    for chiplet_name, chiplet_releases in groupby(releases_sorted, key=_CHIPLET_KEY):
+        chiplet_total_size = chiplet_breakdown[chiplet_name]['size_bytes']
+        chiplet_count = chiplet_breakdown[chiplet_name]['count']
+        chiplet_html = escape(chiplet_name)
+        
+        # Group by unit within chiplet (already in unit order)
+        unit_row_data = []
+        for unit_name, unit_releases in groupby(chiplet_releases, key=_UNIT_KEY):
+            unit_size = unit_breakdown[(chiplet_name, unit_name)]['size_bytes']
+            unit_count = unit_breakdown[(chiplet_name, unit_name)]['count']
+            owners = ', '.join(sorted({r.owner for r in unit_releases}))
+            unit_row_data.append((unit_name, owners, unit_count, format_bytes(unit_size)))
+        unit_rows = render_rows('unit_rows', unit_row_data)
+        
+        chiplet_section_parts.append(f'''
         <div class="chiplet-section">
-            <div class="chiplet-header" onclick="toggleChiplet('{chiplet_name}')">
-                <span class="toggle-icon" id="icon-{chiplet_name}">▼</span>
-                <strong>{chiplet_name}</strong>
+            <div class="chiplet-header" onclick="toggleChiplet('{chiplet_html}')">
+                <span class="toggle-icon" id="icon-{chiplet_html}">▼</span>
+                <strong>{chiplet_html}</strong>
                 <span style="margin-left: 20px; color: #666;">
                     {chiplet_count} releases | {format_bytes(chiplet_total_size)}
                 </span>
             </div>
-            <div class="chiplet-content" id="content-{chiplet_name}">
-                <table style="width: 100%; border-collapse: collapse;">
-                    <thead>
-                        <tr style="background-color: #f8f9fa;">
-                            <th style="padding: 10px; text-align: left; border-bottom: 2px solid #dee2e6;">Unit</th>
-                            <th style="padding: 10px; text-align: left; border-bottom: 2px solid #dee2e6;">Owners</th>
-                            <th style="padding: 10px; text-align: center; border-bottom: 2px solid #dee2e6;"># Releases</th>
-                            <th style="padding: 10px; text-align: right; border-bottom: 2px solid #dee2e6;">Total Size</th>
-                        </tr>
-                    </thead>
+            <div class="chiplet-content" id="content-{chiplet_html}">
+                <table style="width: 100%; border-collapse: collapse;" data-thead="chiplet-thead-tpl">
                     <tbody>
                         {unit_rows}
                     </tbody>
                 </table>
             </div>
-        </div>'''
+        </div>''')
     
     # Build owner rows for "By Owner" tab
-    owner_rows = ''
-    for owner_email in sorted(owner_groups.keys()):
-        owner_data = owner_groups[owner_email]
-        chiplets = ', '.join(sorted(owner_data['chiplets']))
-        units = ', '.join(sorted(owner_data['units']))
-        
-        owner_rows += f'''
-        <tr>
-            <td style="padding: 10px; border-bottom: 1px solid #dee2e6; font-weight: bold;">{owner_email}</td>
-            <td style="padding: 10px; border-bottom: 1px solid #dee2e6;">{chiplets}</td>
-            <td style="padding: 10px; border-bottom: 1px solid #dee2e6;">{units}</td>
-            <td style="padding: 10px; border-bottom: 1px solid #dee2e6; text-align: center;">{len(owner_data['releases'])}</td>
-            <td style="padding: 10px; border-bottom: 1px solid #dee2e6; text-align: right; font-weight: bold;">{format_bytes(owner_data['total_size'])}</td>
-        </tr>'''
-    
-    # Build complete HTML dashboard
-    html_content = f'''<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <title>AGUR Release Cleanup Dashboard</title>
-    <script src="https://cdn.jsdelivr.net/npm/chart.js@4.4.0/dist/chart.umd.min.js"></script>
-    <style>
-        * {{ box-sizing: border-box; margin: 0; padding: 0; }}
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Arial, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            padding: 20px;
-        }}
-        .dashboard-container {{
-            max-width: 95%;
-            margin: 0 auto;
-            background: white;
-            border-radius: 12px;
-            box-shadow: 0 20px 60px rgba(0,0,0,0.3);
-            overflow: hidden;
-        }}
-        .header {{
-            background: linear-gradient(135deg, #1e3c72 0%, #2a5298 100%);
-            color: white;
-            padding: 30px;
-            text-align: center;
-        }}
-        .header h1 {{
-            font-size: 32px;
-            margin-bottom: 10px;
-            font-weight: 700;
-        }}
-        .header .subtitle {{
-            font-size: 16px;
-            opacity: 0.9;
-        }}
-        .tabs {{
-            display: flex;
-            background: #f8f9fa;
-            border-bottom: 2px solid #dee2e6;
-            overflow-x: auto;
-        }}
-        .tab {{
-            padding: 15px 25px;
-            cursor: pointer;
-            border: none;
-            background: transparent;
-            font-size: 15px;
-            font-weight: 500;
-            color: #6c757d;
-            transition: all 0.3s;
-            white-space: nowrap;
-        }}
-        .tab:hover {{
-            background: #e9ecef;
-            color: #495057;
-        }}
-        .tab.active {{
-            background: white;
-            color: #0d47a1;
-            border-bottom: 3px solid #0d47a1;
-        }}
-        .tab-content {{
-            display: none;
-            padding: 30px;
-            animation: fadeIn 0.3s;
-        }}
-        .tab-content.active {{
-            display: block;
-        }}
-        @keyframes fadeIn {{
-            from {{ opacity: 0; transform: translateY(10px); }}
-            to {{ opacity: 1; transform: translateY(0); }}
-        }}
-        .stats-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-            gap: 20px;
-            margin-bottom: 30px;
-        }}
-        .stat-card {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 25px;
-            border-radius: 8px;
-            box-shadow: 0 4px 12px rgba(0,0,0,0.15);
-        }}
-        .stat-card.green {{
-            background: linear-gradient(135deg, #11998e 0%, #38ef7d 100%);
-        }}
-        .stat-card.orange {{
-            background: linear-gradient(135deg, #ee0979 0%, #ff6a00 100%);
-        }}
-        .stat-card.blue {{
-            background: linear-gradient(135deg, #2196F3 0%, #21CBF3 100%);
-        }}
-        .stat-value {{
-            font-size: 36px;
-            font-weight: 700;
-            margin: 10px 0;
-        }}
-        .stat-label {{
-            font-size: 14px;
-            opacity: 0.9;
-            text-transform: uppercase;
-            letter-spacing: 1px;
-        }}
-        .charts-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(400px, 1fr));
-            gap: 30px;
-            margin: 30px 0;
-        }}
-        .chart-card {{
-            background: #f8f9fa;
-            padding: 25px;
-            border-radius: 8px;
-            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-        }}
-        .chart-title {{
-            font-size: 18px;
-            font-weight: 600;
-            color: #212529;
-            margin-bottom: 20px;
-            text-align: center;
-        }}
-        table {{
-            width: 100%;
-            border-collapse: collapse;
-            background: white;
-            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-            border-radius: 8px;
-            overflow: hidden;
-        }}
-        th {{
-            background: #f8f9fa;
-            padding: 12px;
-            text-align: left;
-            font-size: 13px;
-            font-weight: 600;
-            color: #495057;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-            border-bottom: 2px solid #dee2e6;
-        }}
-        td {{
-            padding: 10px;
-            font-size: 13px;
-            color: #212529;
-            border-bottom: 1px solid #f1f3f5;
-            vertical-align: top;
-        }}
-        tr:hover {{
-            background: #f8f9fa;
-        }}
-        .alert {{
-            background: #fff3cd;
-            border-left: 4px solid #ffc107;
-            padding: 20px;
-            margin: 20px 0;
-            border-radius: 4px;
-        }}
-        .alert strong {{
-            color: #856404;
-            font-size: 16px;
-        }}
-        .chiplet-section {{
-            margin: 15px 0;
-            border: 1px solid #dee2e6;
-            border-radius: 8px;
-            overflow: hidden;
-        }}
-        .chiplet-header {{
-            background: #f8f9fa;
-            padding: 15px 20px;
-            cursor: pointer;
-            font-size: 16px;
-            transition: background 0.3s;
-            user-select: none;
-        }}
-        .chiplet-header:hover {{
-            background: #e9ecef;
-        }}
-        .chiplet-content {{
-            padding: 20px;
-            background: white;
-        }}
-        .chiplet-content.collapsed {{
-            display: none;
-        }}
-        .toggle-icon {{
-            display: inline-block;
-            margin-right: 10px;
-            transition: transform 0.3s;
-            font-size: 12px;
-        }}
-        .toggle-icon.collapsed {{
-            transform: rotate(-90deg);
-        }}
-        .approval-panel {{
-            background: #fff;
-            padding: 20px;
-            margin: 20px;
-            border-radius: 8px;
-            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-        }}
-        .approval-stats {{
-            display: flex;
-            gap: 30px;
-            margin-bottom: 15px;
-            font-size: 16px;
-        }}
-        .approval-stats span {{
-            color: #666;
-        }}
-        .approval-stats strong {{
-            color: #212529;
-            font-size: 20px;
-        }}
-        .approval-actions {{
-            display: flex;
-            gap: 15px;
-            margin-bottom: 15px;
-        }}
-        .btn {{
-            padding: 10px 20px;
-            border: none;
-            border-radius: 4px;
-            cursor: pointer;
-            font-size: 14px;
-            font-weight: 500;
-            transition: all 0.3s;
-        }}
-        .btn:hover {{
-            transform: translateY(-2px);
-            box-shadow: 0 4px 8px rgba(0,0,0,0.2);
-        }}
-        .btn-primary {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-        }}
-        .btn-secondary {{
-            background: #6c757d;
-            color: white;
-        }}
-        .btn:disabled {{
-            opacity: 0.5;
-            cursor: not-allowed;
-        }}
-        .status-message {{
-            padding: 10px;
-            border-radius: 4px;
-            margin-top: 10px;
-            display: none;
-        }}
-        .status-message.success {{
-            background: #d4edda;
-            color: #155724;
-            border: 1px solid #c3e6cb;
-            display: block;
-        }}
-        .status-message.error {{
-            background: #f8d7da;
-            color: #721c24;
-            border: 1px solid #f5c6cb;
-            display: block;
-        }}
-        .approval-checkbox {{
-            width: 18px;
-            height: 18px;
-            cursor: pointer;
-        }}
-        .emailed-release {{
-            background-color: #d4edda !important;
-            border-left: 4px solid #28a745 !important;
-        }}
-        .emailed-badge {{
-            display: inline-block;
-            padding: 2px 8px;
-            background-color: #28a745;
-            color: white;
-            border-radius: 3px;
-            font-size: 11px;
-            font-weight: bold;
-            margin-left: 10px;
-        }}
-        .emailed-badge-test {{
-            display: inline-block;
-            padding: 2px 8px;
-            background-color: #fd7e14;
-            color: white;
-            border-radius: 3px;
-            font-size: 11px;
-            font-weight: bold;
-            margin-left: 10px;
-        }}
-        .section-title {{
-            font-size: 24px;
-            color: #212529;
-            margin: 30px 0 20px 0;
-            font-weight: 600;
-            border-bottom: 3px solid #0d47a1;
-            padding-bottom: 10px;
-        }}
-    </style>
-</head>
-<body>
-    <div class="dashboard-container">
-        <div class="header">
-            <h1>🗂️ AGUR Release Cleanup Dashboard</h1>
-            <div class="subtitle">Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} | Age Threshold: 90 days</div>
-        </div>
-        
-        <div class="approval-panel">
-            <div class="approval-stats">
-                <span>Total Releases: <strong id="total-releases">0</strong></span>
-                <span>Approved: <strong id="approved-count" style="color: #28a745;">0</strong></span>
-                <span>Emailed: <strong id="emailed-count" style="color: #17a2b8;">0</strong></span>
-                <span>Pending: <strong id="pending-count" style="color: #ffc107;">0</strong></span>
-            </div>
-            <div class="approval-actions">
-                <button id="select-all-btn" class="btn btn-secondary">Select All Visible</button>
-                <button id="clear-all-btn" class="btn btn-secondary">Clear All Selections</button>
-                <button id="send-emails-btn" class="btn btn-primary" disabled>Send Emails for Approved Releases</button>
-            </div>
-            <div id="status-message" class="status-message"></div>
-        </div>
-        
-        <div class="tabs">
-            <button class="tab active" onclick="switchTab('summary')">📊 Summary</button>
-            <button class="tab" onclick="switchTab('chiplet')">🔧 By Chiplet</button>
-            <button class="tab" onclick="switchTab('unit')">📦 By Unit</button>
-            <button class="tab" onclick="switchTab('owner')">👤 By Owner</button>
-        </div>
-        
-        <!-- SUMMARY TAB -->
-        <div id="tab-summary" class="tab-content active">
-            <div class="alert">
-                <strong>⚠️ Critical Disk Usage Alert</strong><br/>
-                AGUR Release Area: 90% capacity (108T/120T used). Immediate action required to prevent workflow disruption.
-            </div>
-            
-            <div class="stats-grid">
-                <div class="stat-card orange">
-                    <div class="stat-label">Old Releases</div>
-                    <div class="stat-value">{total_releases}</div>
-                </div>
-                <div class="stat-card blue">
-                    <div class="stat-label">Reclaimable Space</div>
-                    <div class="stat-value">{total_size_human}</div>
-                </div>
-                <div class="stat-card">
-                    <div class="stat-label">Current Utilization</div>
-                    <div class="stat-value">{current_utilization}%</div>
-                </div>
-                <div class="stat-card green">
-                    <div class="stat-label">After Cleanup</div>
-                    <div class="stat-value">{new_utilization:.1f}%</div>
-                </div>
-            </div>
-            
-            <div class="charts-grid">
-                <div class="chart-card">
-                    <div class="chart-title">Release Age Distribution</div>
-                    <canvas id="ageChart"></canvas>
-                </div>
-                <div class="chart-card">
-                    <div class="chart-title">Size by Chiplet</div>
-                    <canvas id="chipletChart"></canvas>
-                </div>
-            </div>
-            
-            <div class="section-title">Top 10 Space Consumers</div>
-            <table>
-                <thead>
-                    <tr>
-                        <th>Unit</th>
-                        <th>Owner</th>
-                        <th>Chiplet</th>
-                        <th style="text-align: center;"># Releases</th>
-                        <th style="text-align: right;">Total Size</th>
-                    </tr>
-                </thead>
-                <tbody>'''
-    
-    for consumer in top_consumers:
-        html_content += f'''
-                    <tr>
-                        <td style="font-weight: bold;">{consumer['unit']}</td>
-                        <td>{consumer['owner']}</td>
-                        <td>{consumer['chiplet']}</td>
-                        <td style="text-align: center;">{consumer['count']}</td>
-                        <td style="text-align: right; font-weight: bold; color: #dc3545;">{format_bytes(consumer['size_bytes'])}</td>
-                    </tr>'''
-    
-    html_content += f'''
-                </tbody>
-            </table>
-            
-            <div style="margin-top: 30px; padding: 20px; background: #e7f3ff; border-radius: 8px; border-left: 4px solid #2196F3;">
-                <h3 style="color: #1976D2; margin-bottom: 10px;">📈 Coordination Statistics</h3>
-                <ul style="list-style: none; padding: 0;">
-                    <li style="padding: 8px 0; font-size: 14px;">✅ <strong>No Symlinks:</strong> {coord_stats['no_symlinks']} releases (safe to delete)</li>
-                    <li style="padding: 8px 0; font-size: 14px;">🔗 <strong>Self-Owned Symlinks:</strong> {coord_stats['self_symlinks']} releases (remove symlinks first)</li>
-                    <li style="padding: 8px 0; font-size: 14px;">⚠️ <strong>Coordination Needed:</strong> {coord_stats['coordination_needed']} releases (multi-user action required)</li>
-                </ul>
-            </div>
-        </div>
+    owner_row_data = [
+        (owner_email, ', '.join(owner_data['chiplets']), ', '.join(owner_data['units']),
+         len(owner_data['releases']), format_bytes(owner_data['total_size']))
+        for owner_email, owner_data in sorted(owner_groups.items())
+    ]
+    owner_rows = render_rows('owner_rows', owner_row_data)
+    
+    # Stream the complete HTML dashboard from the cached template straight to
+    # disk (the chiplet sections are written one by one, never joined)
+    page = _get_template('dashboard.html.j2').stream(
+        generated_at=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        total_releases=total_releases,
+        total_size_human=total_size_human,
+        current_utilization=current_utilization,
+        current_used_tb=current_used_tb,
+        total_capacity_tb=total_capacity_tb,
+        new_utilization=new_utilization,
+        new_used_tb=new_used_tb,
+        coord_stats=coord_stats,
+        chart_data_json=chart_data_json,
+        # Pre-rendered fragments - already escaped, mark them safe
+        top_consumer_rows=Markup(render_rows('top_consumer_rows', [
+            (c['unit'], c['owner'], c['chiplet'], c['count'], format_bytes(c['size_bytes']))
+            for c in top_consumers
+        ])),
+        chiplet_sections=[Markup(section) for section in chiplet_section_parts],
+        unit_by_chiplet_sections=[Markup(section) for section in unit_by_chiplet_parts],
+        owner_rows=Markup(owner_rows)
+    )
+    # Group the stream's small template chunks so dump() issues few large writes
+    page.enable_buffering(64)
+    
+    with open(output_file, 'w', buffering=1 << 20) as f:
+        page.dump(f)
+    
+    logger.info(f"  Dashboard generated with {len(chiplet_breakdown)} chiplets, {len(unit_owner_summary)} unit-owner pairs, {len(owner_groups)} owners")
+
+def generate_markdown_summary(owner_recommendations: Dict[str, OwnerRecommendation], 
+                              releases: List[ReleaseInfo], 
+                              output_file: Path,
+                              age_threshold: int,
+                              stats: Optional[Dict] = None):
+    """
+    Generate markdown summary report
+    
+    Args:
+        owner_recommendations: Dict of OwnerRecommendation objects keyed by owner email
+        releases: List of ReleaseInfo objects
+        output_file: Path of the Markdown file to write
+        age_threshold: Age threshold in days, shown in the header
+        stats: Precomputed calculate_release_stats(releases, 10) result, computed here if None
+    """
+    logger.info(f"  Writing Markdown summary: {output_file}")
+    
+    total_releases = len(releases)
+    
+    # Totals come from the shared single-pass release stats
+    if stats is None:
+        stats = calculate_release_stats(releases, 10)
+    chiplet_stats = stats['chiplet_breakdown']
+    coord_stats = stats['coordination']
+    total_size = sum(c['size_bytes'] for c in chiplet_stats.values())
+    coordination_needed = coord_stats['coordination_needed']
+    protected_releases = coordination_needed + coord_stats['self_symlinks']
+    
+    with open(output_file, 'w') as f:
+        f.write(
+            f"# AGUR Release Area Cleanup Report\n\n"
+            f"**Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}  \n"
+            f"**Age Threshold**: {age_threshold} days  \n"
+            f"**Disk Usage**: 90% (108T/120T) - **CRITICAL**\n\n"
+        )
         
-        <!-- BY CHIPLET TAB -->
-        <div id="tab-chiplet" class="tab-content">
-            <h2 class="section-title">Releases Grouped by Chiplet</h2>
-            <p style="color: #666; margin-bottom: 20px; font-size: 14px;">
-                Click on a chiplet to expand/collapse details. Each section shows units and their space consumption.
-            </p>
-            {chiplet_sections}
-        </div>
-        
-        <!-- BY UNIT TAB -->
-        <div id="tab-unit" class="tab-content">
-            <h2 class="section-title">Detailed Unit Summary by Chiplet</h2>
-            <p style="color: #666; margin-bottom: 20px; font-size: 14px;">
-                Click on a chiplet to expand/collapse details. Each section shows units with their owners, release areas, and symlinks.
-            </p>
-            
-            <div style="background: #e7f3ff; padding: 15px; border-radius: 8px; margin-bottom: 20px; border-left: 4px solid #2196F3;">
-                <strong style="color: #1976D2;">📊 Overall Summary:</strong>
-                <span style="color: #1976D2; margin-left: 20px;">
-                    <strong>{total_releases}</strong> releases | 
-                    <strong style="color: #dc3545;">{total_size_human}</strong> reclaimable
-                </span>
-                <br/>
-                <span style="color: #1976D2;">
-                    Impact: Current {current_utilization}% ({current_used_tb}TB/{total_capacity_tb}TB) → 
-                    After cleanup: <strong>{new_utilization:.1f}%</strong> (~{new_used_tb:.1f}TB/{total_capacity_tb}TB)
-                </span>
-            </div>
-            
-            {unit_by_chiplet_sections}
-        </div>
-        
-        <!-- BY OWNER TAB -->
-        <div id="tab-owner" class="tab-content">
-            <h2 class="section-title">Owner-Centric View</h2>
-            <p style="color: #666; margin-bottom: 20px; font-size: 14px;">
-                Aggregated view showing each owner's total impact across all units and chiplets.
-            </p>
-            <table>
-                <thead>
-                    <tr>
-                        <th style="width: 25%;">Owner Email</th>
-                        <th style="width: 20%;">Chiplets</th>
-                        <th style="width: 35%;">Units</th>
-                        <th style="width: 10%; text-align: center;"># Releases</th>
-                        <th style="width: 10%; text-align: right;">Total Size</th>
-                    </tr>
-                </thead>
-                <tbody>
-                    {owner_rows}
-                </tbody>
-            </table>
-        </div>
-    </div>
-    
-    <script>
-        // API base URL
-        const API_BASE = 'http://localhost:5000/api';
-        
-        // Load approval state on page load
-        async function loadApprovalState() {{
-            try {{
-                const response = await fetch(`${{API_BASE}}/releases`);
-                const data = await response.json();
-                
-                if (data.success) {{
-                    // Update checkboxes based on loaded state
-                    data.releases.forEach(release => {{
-                        const checkbox = document.querySelector(`input[data-release-id="${{release.id}}"]`);
-                        if (checkbox) {{
-                            checkbox.checked = release.approved;
-                        }}
-                    }});
-                    
-                    // Update stats
-                    await updateApprovalStats();
-                }}
-            }} catch (error) {{
-                console.error('Error loading approval state:', error);
-                showStatus('Error connecting to server. Make sure you ran with --interactive flag.', 'error');
-            }}
-        }}
-        
-        // Toggle approval for a release
-        async function toggleApproval(releaseId, approved) {{
-            try {{
-                const response = await fetch(`${{API_BASE}}/approve`, {{
-                    method: 'POST',
-                    headers: {{ 'Content-Type': 'application/json' }},
-                    body: JSON.stringify({{ release_id: releaseId, approved: approved }})
-                }});
-                
-                const data = await response.json();
-                
-                if (data.success) {{
-                    await updateApprovalStats();
-                }}
-            }} catch (error) {{
-                console.error('Error toggling approval:', error);
-                showStatus('Error updating approval status', 'error');
-            }}
-        }}
-        
-        // Apply green highlighting to specific releases dynamically
-        function applyEmailedStyling(releaseIds, isTestMode) {{
-            releaseIds.forEach(releaseId => {{
-                // Find the table row
-                const row = document.querySelector(`tr[data-release-id="${{releaseId}}"]`);
-                if (!row) return;
-                
-                // Add green background class
-                row.classList.add('emailed-release');
-                
-                // Find the unit name cell (second td)
-                const unitCell = row.querySelectorAll('td')[1];
-                if (!unitCell) return;
-                
-                // Check if badge already exists
-                const existingBadge = unitCell.querySelector('.emailed-badge, .emailed-badge-test');
-                if (existingBadge) {{
-                    // Badge exists - increment count
-                    const match = existingBadge.textContent.match(/(\d+)x/);
-                    if (match) {{
-                        const currentCount = parseInt(match[1]);
-                        const newCount = currentCount + 1;
-                        existingBadge.textContent = `✉ ${{newCount}}x`;
-                        // Update class if test mode changed
-                        if (isTestMode) {{
-                            existingBadge.className = 'emailed-badge-test';
-                        }} else {{
-                            existingBadge.className = 'emailed-badge';
-                        }}
-                    }}
-                    return;
-                }}
-                
-                // Create and insert new badge with count 1
-                const badge = document.createElement('span');
-                if (isTestMode) {{
-                    badge.className = 'emailed-badge-test';
-                    badge.textContent = '✉ 1x';
-                }} else {{
-                    badge.className = 'emailed-badge';
-                    badge.textContent = '✉ 1x';
-                }}
-                unitCell.appendChild(badge);
-            }});
-        }}
-        
-        // Update approval statistics
-        async function updateApprovalStats() {{
-            try {{
-                const response = await fetch(`${{API_BASE}}/status`);
-                const data = await response.json();
-                
-                if (data.success) {{
-                    // Count only releases that are visible in the current dashboard (not filtered out)
-                    const allCheckboxes = Array.from(document.querySelectorAll('.approval-checkbox'));
-                    const visibleReleaseIds = new Set(allCheckboxes.map(cb => cb.dataset.releaseId));
-                    
-                    // Load approval state to check which visible releases are approved
-                    const stateResponse = await fetch(`${{API_BASE}}/releases`);
-                    const stateData = await stateResponse.json();
-                    
-                    let visibleApprovedCount = 0;
-                    let visibleEmailedCount = 0;
-                    
-                    if (stateData.success) {{
-                        stateData.releases.forEach(release => {{
-                            if (visibleReleaseIds.has(release.id)) {{
-                                if (release.approved) visibleApprovedCount++;
-                                if (release.emailed) visibleEmailedCount++;
-                            }}
-                        }});
-                    }}
-                    
-                    const totalVisible = allCheckboxes.length;
-                    const pendingVisible = totalVisible - visibleApprovedCount;
-                    
-                    // Update counters with visible release counts
-                    document.getElementById('total-releases').textContent = totalVisible;
-                    document.getElementById('approved-count').textContent = visibleApprovedCount;
-                    document.getElementById('emailed-count').textContent = visibleEmailedCount;
-                    document.getElementById('pending-count').textContent = pendingVisible;
-                    
-                    // Enable/disable send button based on visible approved releases
-                    const sendBtn = document.getElementById('send-emails-btn');
-                    sendBtn.disabled = visibleApprovedCount === 0;
-                }}
-            }} catch (error) {{
-                console.error('Error updating stats:', error);
-            }}
-        }}
-        
-        // Send emails for approved releases
-        async function sendApprovedEmails() {{
-            if (!confirm('Send emails for all approved releases? This action cannot be undone.')) {{
-                return;
-            }}
-            
-            showStatus('Sending emails...', 'success');
-            document.getElementById('send-emails-btn').disabled = true;
-            
-            try {{
-                const response = await fetch(`${{API_BASE}}/send_emails`, {{
-                    method: 'POST',
-                    headers: {{ 'Content-Type': 'application/json' }},
-                    body: JSON.stringify({{}})
-                }});
-                
-                const data = await response.json();
-                
-                if (data.success) {{
-                    const testModeMsg = data.test_mode ? ' (TEST MODE - emails sent to current user only)' : '';
-                    let message = `Success! Emails sent for ${{data.total_sent}} release(s)${{testModeMsg}}`;
-                    
-                    if (data.resends > 0) {{
-                        message += `\\n(${{data.new_sends}} new, ${{data.resends}} resent)`;
-                    }}
-                    
-                    // Apply green highlighting and update counts immediately
-                    if (data.newly_emailed_ids && data.newly_emailed_ids.length > 0) {{
-                        applyEmailedStyling(data.newly_emailed_ids, data.test_mode);
-                    }}
-                    
-                    showStatus(message, 'success');
-                    await updateApprovalStats();  // Update the emailed count
-                }} else {{
-                    showStatus(`Error: ${{data.error}}`, 'error');
-                    document.getElementById('send-emails-btn').disabled = false;
-                }}
-            }} catch (error) {{
-                console.error('Error sending emails:', error);
-                showStatus('Error sending emails: ' + error.message, 'error');
-                document.getElementById('send-emails-btn').disabled = false;
-            }}
-        }}
-        
-        // Select all visible releases in current tab
-        async function selectAllVisible() {{
-            const activeTab = document.querySelector('.tab-content.active');
-            if (!activeTab) {{
-                return;
-            }}
-            
-            const checkboxes = Array.from(activeTab.querySelectorAll('.approval-checkbox'));
-            const unchecked = checkboxes.filter(cb => !cb.checked);
-            
-            if (unchecked.length === 0) {{
-                showStatus('All visible releases are already approved', 'success');
-                return;
-            }}
-            
-            // Disable buttons during operation
-            document.getElementById('select-all-btn').disabled = true;
-            document.getElementById('clear-all-btn').disabled = true;
-            showStatus(`Approving ${{unchecked.length}} releases...`, 'success');
-            
-            let successCount = 0;
-            let failCount = 0;
-            
-            // Process checkboxes sequentially to avoid overwhelming the server
-            for (const cb of unchecked) {{
-                cb.checked = true;
-                try {{
-                    await toggleApproval(cb.dataset.releaseId, true);
-                    successCount++;
-                    
-                    // Small delay to avoid overwhelming the server
-                    if (successCount % 10 === 0) {{
-                        showStatus(`Progress: ${{successCount}}/${{unchecked.length}} approved...`, 'success');
-                    }}
-                }} catch (error) {{
-                    console.error('Error approving release:', cb.dataset.releaseId, error);
-                    failCount++;
-                    cb.checked = false;  // Uncheck if failed
-                }}
-            }}
-            
-            // Re-enable buttons
-            document.getElementById('select-all-btn').disabled = false;
-            document.getElementById('clear-all-btn').disabled = false;
-            
-            if (failCount === 0) {{
-                showStatus(`Success! Approved ${{successCount}} releases`, 'success');
-            }} else {{
-                showStatus(`Approved ${{successCount}}, Failed ${{failCount}}. Please try again for failed items.`, 'error');
-            }}
-        }}
-        
-        // Clear all selections
-        async function clearAllSelections() {{
-            if (!confirm('Clear all approval selections?')) {{
-                return;
-            }}
-            
-            const checkboxes = Array.from(document.querySelectorAll('.approval-checkbox'));
-            const checked = checkboxes.filter(cb => cb.checked);
-            
-            if (checked.length === 0) {{
-                showStatus('No releases are currently approved', 'success');
-                return;
-            }}
-            
-            // Disable buttons during operation
-            document.getElementById('select-all-btn').disabled = true;
-            document.getElementById('clear-all-btn').disabled = true;
-            showStatus(`Clearing ${{checked.length}} approvals...`, 'success');
-            
-            let successCount = 0;
-            let failCount = 0;
-            
-            // Process checkboxes sequentially
-            for (const cb of checked) {{
-                cb.checked = false;
-                try {{
-                    await toggleApproval(cb.dataset.releaseId, false);
-                    successCount++;
-                    
-                    // Update progress
-                    if (successCount % 10 === 0) {{
-                        showStatus(`Progress: ${{successCount}}/${{checked.length}} cleared...`, 'success');
-                    }}
-                }} catch (error) {{
-                    console.error('Error clearing approval:', cb.dataset.releaseId, error);
-                    failCount++;
-                    cb.checked = true;  // Recheck if failed
-                }}
-            }}
-            
-            // Re-enable buttons
-            document.getElementById('select-all-btn').disabled = false;
-            document.getElementById('clear-all-btn').disabled = false;
-            
-            if (failCount === 0) {{
-                showStatus(`Success! Cleared ${{successCount}} approvals`, 'success');
-            }} else {{
-                showStatus(`Cleared ${{successCount}}, Failed ${{failCount}}. Please try again for failed items.`, 'error');
-            }}
-        }}
-        
-        // Show status message
-        function showStatus(message, type) {{
-            const statusDiv = document.getElementById('status-message');
-            statusDiv.textContent = message;
-            statusDiv.className = `status-message ${{type}}`;
-            
-            if (type === 'success') {{
-                setTimeout(() => {{
-                    statusDiv.style.display = 'none';
-                }}, 5000);
-            }}
-        }}
-        
-        // Initialize on page load
-        document.addEventListener('DOMContentLoaded', async () => {{
-            // Load approval state
-            await loadApprovalState();
-            
-            // Add event listeners to checkboxes
-            document.querySelectorAll('.approval-checkbox').forEach(checkbox => {{
-                checkbox.addEventListener('change', (e) => {{
-                    toggleApproval(e.target.dataset.releaseId, e.target.checked);
-                }});
-            }});
-            
-            // Add event listeners to buttons
-            document.getElementById('select-all-btn').addEventListener('click', selectAllVisible);
-            document.getElementById('clear-all-btn').addEventListener('click', clearAllSelections);
-            document.getElementById('send-emails-btn').addEventListener('click', sendApprovedEmails);
-        }});
-        
-        // Tab switching
-        function switchTab(tabName) {{
-            // Hide all tabs
-            document.querySelectorAll('.tab-content').forEach(tab => {{
-                tab.classList.remove('active');
-            }});
-            document.querySelectorAll('.tab').forEach(btn => {{
-                btn.classList.remove('active');
-            }});
-            
-            // Show selected tab
-            document.getElementById('tab-' + tabName).classList.add('active');
-            event.target.classList.add('active');
-        }}
-        
-        // Chiplet expand/collapse
-        function toggleChiplet(chipletName) {{
-            const content = document.getElementById('content-' + chipletName);
-            const icon = document.getElementById('icon-' + chipletName);
-            
-            if (content.classList.contains('collapsed')) {{
-                content.classList.remove('collapsed');
-                icon.classList.remove('collapsed');
-                icon.textContent = '▼';
-            }} else {{
-                content.classList.add('collapsed');
-                icon.classList.add('collapsed');
-                icon.textContent = '▶';
-            }}
-        }}
-        
-        // Chart.js visualizations
-        const ageCtx = document.getElementById('ageChart').getContext('2d');
-        new Chart(ageCtx, {{
-            type: 'bar',
-            data: {{
-                labels: {json.dumps(age_labels)},
-                datasets: [{{
-                    label: 'Number of Releases',
-                    data: {json.dumps(age_values)},
-                    backgroundColor: 'rgba(102, 126, 234, 0.8)',
-                    borderColor: 'rgba(102, 126, 234, 1)',
-                    borderWidth: 2
-                }}]
-            }},
-            options: {{
-                responsive: true,
-                maintainAspectRatio: true,
-                plugins: {{
-                    legend: {{ display: false }},
-                    title: {{ display: false }}
-                }},
-                scales: {{
-                    y: {{
-                        beginAtZero: true,
-                        ticks: {{ precision: 0 }}
-                    }}
-                }}
-            }}
-        }});
-        
-        const chipletCtx = document.getElementById('chipletChart').getContext('2d');
-        new Chart(chipletCtx, {{
-            type: 'doughnut',
-            data: {{
-                labels: {json.dumps(chiplet_labels)},
-                datasets: [{{
-                    label: 'Size (GB)',
-                    data: {json.dumps(chiplet_sizes)},
-                    backgroundColor: [
-                        'rgba(255, 99, 132, 0.8)',
-                        'rgba(54, 162, 235, 0.8)',
-                        'rgba(255, 206, 86, 0.8)',
-                        'rgba(75, 192, 192, 0.8)',
-                        'rgba(153, 102, 255, 0.8)',
-                        'rgba(255, 159, 64, 0.8)',
-                        'rgba(199, 199, 199, 0.8)'
-                    ],
-                    borderWidth: 2
-                }}]
-            }},
-            options: {{
-                responsive: true,
-                maintainAspectRatio: true,
-                plugins: {{
-                    legend: {{
-                        position: 'right'
-                    }}
-                }}
-            }}
-        }});
-    </script>
-</body>
-</html>'''
-    
-    with open(output_file, 'w') as f:
-        f.write(html_content)
-    
-    logger.info(f"  Dashboard generated with {len(chiplet_groups)} chiplets, {len(unit_owner_summary)} unit-owner pairs, {len(owner_groups)} owners")
-
-def generate_markdown_summary(owner_recommendations: Dict[str, OwnerRecommendation], 
-                              releases: List[ReleaseInfo], 
-                              output_file: Path,
-                              age_threshold: int):
-    """Generate markdown summary report"""
-    logger.info(f"  Writing Markdown summary: {output_file}")
-    
-    total_size = sum(r.size_bytes for r in releases)
-    total_releases = len(releases)
-    coordination_needed = sum(1 for r in releases if r.requires_coordination)
-    protected_releases = sum(1 for r in releases if r.has_symlinks)
-    
-    # Group by chiplet
-    chiplet_stats = {}
-    for release in releases:
-        if release.chiplet not in chiplet_stats:
-            chiplet_stats[release.chiplet] = {'count': 0, 'size': 0}
-        chiplet_stats[release.chiplet]['count'] += 1
-        chiplet_stats[release.chiplet]['size'] += release.size_bytes
-    
-    with open(output_file, 'w') as f:
-        f.write(f"# AGUR Release Area Cleanup Report\n\n")
-        f.write(f"**Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}  \n")
-        f.write(f"**Age Threshold**: {age_threshold} days  \n")
-        f.write(f"**Disk Usage**: 90% (108T/120T) - **CRITICAL**\n\n")
-        
-        f.write(f"## Overview\n\n")
-        f.write(f"- **Total Old Releases**: {total_releases}\n")
-        f.write(f"- **Total Reclaimable Space**: {format_bytes(total_size)}\n")
-        f.write(f"- **Protected by Symlinks**: {protected_releases} releases\n")
-        f.write(f"- **Require Coordination**: {coordination_needed} releases\n")
-        f.write(f"- **Unique Owners**: {len(owner_recommendations)}\n\n")
+        f.write(
+            f"## Overview\n\n"
+            f"- **Total Old Releases**: {total_releases}\n"
+            f"- **Total Reclaimable Space**: {format_bytes(total_size)}\n"
+            f"- **Protected by Symlinks**: {protected_releases} releases\n"
+            f"- **Require Coordination**: {coordination_needed} releases\n"
+            f"- **Unique Owners**: {len(owner_recommendations)}\n\n"
+        )
         
         f.write(f"## Impact\n\n")
         current_usage = 90
-        freed_percent = (total_size / (120 * 1024**4)) * 100  # 120TB total
+        freed_percent = (total_size / (120 * BYTES_PER_TB)) * 100  # 120TB total
         new_usage = current_usage - freed_percent
-        f.write(f"If all old releases are removed:\n")
-        f.write(f"- Current usage: **{current_usage}%** (CRITICAL)\n")
-        f.write(f"- After cleanup: **~{new_usage:.1f}%** (estimated)\n")
-        f.write(f"- Space freed: **{format_bytes(total_size)}** (~{freed_percent:.1f}% of total)\n\n")
-        
-        f.write(f"## By Chiplet\n\n")
-        f.write(f"| Chiplet | Releases | Reclaimable Space | Manager |\n")
-        f.write(f"|---------|----------|-------------------|----------|\n")
-        for chiplet in sorted(chiplet_stats.keys()):
-            stats = chiplet_stats[chiplet]
-            manager = CHIPLET_MANAGERS.get(chiplet, 'N/A')
-            f.write(f"| {chiplet} | {stats['count']} | {format_bytes(stats['size'])} | {manager} |\n")
+        f.write(
+            f"If all old releases are removed:\n"
+            f"- Current usage: **{current_usage}%** (CRITICAL)\n"
+            f"- After cleanup: **~{new_usage:.1f}%** (estimated)\n"
+            f"- Space freed: **{format_bytes(total_size)}** (~{freed_percent:.1f}% of total)\n\n"
+        )
+        
+        # Tables are built as one string each and written once
+        get_manager = CHIPLET_MANAGERS.get
+        f.write(
+            f"## By Chiplet\n\n"
+            f"| Chiplet | Releases | Reclaimable Space | Manager |\n"
+            f"|---------|----------|-------------------|----------|\n"
+        )
+        f.write(''.join([
+            f"| {chiplet} | {totals['count']} | {format_bytes(totals['size_bytes'])} | {get_manager(chiplet, 'N/A')} |\n"
+            for chiplet, totals in sorted(chiplet_stats.items())
+        ]))
         f.write(f"\n")
         
-        f.write(f"## By Owner\n\n")
-        f.write(f"| Owner | Releases | Units | Reclaimable Space | Coordination |\n")
-        f.write(f"|-------|----------|-------|-------------------|---------------|\n")
+        f.write(
+            f"## By Owner\n\n"
+            f"| Owner | Releases | Units | Reclaimable Space | Coordination |\n"
+            f"|-------|----------|-------|-------------------|---------------|\n"
+        )
         
-        sorted_owners = sorted(owner_recommendations.items(), 
-                              key=lambda x: x[1].total_size_bytes, 
-                              reverse=True)
+        sorted_owners = sorted(owner_recommendations.values(), key=_OWNER_SIZE_KEY, reverse=True)
         
-        for owner_email, rec in sorted_owners:
-            coord = 'Required' if any(r.requires_coordination for r in rec.releases) else 'No'
-            f.write(f"| {owner_email} | {rec.release_count} | {rec.unit_count} | {rec.total_size_human} | {coord} |\n")
+        f.write(''.join([
+            f"| {rec.owner_email} | {rec.release_count} | {rec.unit_count} | {rec.total_size_human} | "
+            f"{'Required' if any(r.requires_coordination for r in rec.releases) else 'No'} |\n"
+            for rec in sorted_owners
+        ]))
         f.write(f"\n")
         
-        f.write(f"## Top 10 Largest Releases\n\n")
-        f.write(f"| Unit | Release Directory | Age | Size | Owner | Has Symlinks |\n")
-        f.write(f"|------|-------------------|-----|------|-------|---------------|\n")
+        f.write(
+            f"## Top 10 Largest Releases\n\n"
+            f"| Unit | Release Directory | Age | Size | Owner | Has Symlinks |\n"
+            f"|------|-------------------|-----|------|-------|---------------|\n"
+        )
         
-        top_releases = sorted(releases, key=lambda r: r.size_bytes, reverse=True)[:10]
-        for release in top_releases:
-            symlinks = 'Yes' if release.has_symlinks else 'No'
-            f.write(f"| {release.unit} | {release.release_dir[:50]}... | {release.age_days}d | {release.size_human} | {release.owner} | {symlinks} |\n")
+        top_releases = heapq.nlargest(10, releases, key=_SIZE_KEY)
+        f.write(''.join([
+            f"| {release.unit} | {release.release_dir[:50]}... | {release.age_days}d | {release.size_human} | "
+            f"{release.owner} | {'Yes' if release.has_symlinks else 'No'} |\n"
+            for release in top_releases
+        ]))
         f.write(f"\n")
         
-        f.write(f"## Next Steps\n\n")
-        f.write(f"1. **Review Reports**: Check the detailed CSV report for all releases\n")
-        f.write(f"2. **Owner Notifications**: Emails have been sent to all unit owners\n")
-        f.write(f"3. **Coordination**: {coordination_needed} releases require multi-user coordination\n")
-        f.write(f"4. **Cleanup**: Owners must manually execute deletion commands\n")
-        f.write(f"5. **Verification**: Monitor disk usage after cleanup actions\n\n")
+        f.write(
+            f"## Next Steps\n\n"
+            f"1. **Review Reports**: Check the detailed CSV report for all releases\n"
+            f"2. **Owner Notifications**: Emails have been sent to all unit owners\n"
+            f"3. **Coordination**: {coordination_needed} releases require multi-user coordination\n"
+            f"4. **Cleanup**: Owners must manually execute deletion commands\n"
+            f"5. **Verification**: Monitor disk usage after cleanup actions\n\n"
+        )
         
-        f.write(f"## Safety Notes\n\n")
-        f.write(f"- This utility is **analysis-only** - it never deletes anything\n")
-        f.write(f"- All deletions must be performed manually by unit owners\n")
-        f.write(f"- Symlink coordination is critical to avoid broken links\n")
-        f.write(f"- Always verify symlinks before deleting releases\n")
+        f.write(
+            f"## Safety Notes\n\n"
+            f"- This utility is **analysis-only** - it never deletes anything\n"
+            f"- All deletions must be performed manually by unit owners\n"
+            f"- Symlink coordination is critical to avoid broken links\n"
+            f"- Always verify symlinks before deleting releases\n"
+        )
 
+@functools.lru_cache(maxsize=1)
 def load_logo_base64() -> str:
-    """Load logo and encode as base64 for email embedding"""
+    """Load logo and encode as base64 for email embedding (read once per process)"""
     try:
         if os.path.exists(LOGO_PATH):
             with open(LOGO_PATH, 'rb') as f:
@@ -2006,101 +1280,47 @@ def load_logo_base64() -> str:
         logger.debug(f"Could not load logo: {e}")
     return ''
 
-def build_email_html(recommendation: OwnerRecommendation, test_mode: bool = False) -> str:
-    """
-    Build HTML email for cleanup recommendations.
-    
-    Args:
-        recommendation: OwnerRecommendation object
-        test_mode: If True, add test mode banner
-        
-    Returns:
-        HTML string for email body
-    """
-    logo_data = load_logo_base64()
-    
-    # Build logo cell
-    logo_cell = ''
-    if logo_data:
-        logo_cell = f'''
+# Owner email fragments - str.format templates filled by build_email_html and
+# dropped into templates/email.html.j2
+_EMAIL_LOGO_CELL = '''
                         <td style="width: 100px; text-align: center; vertical-align: middle; border-right: 2px solid rgba(255,255,255,0.3); padding: 0 10px;">
                             <img src="data:image/png;base64,{logo_data}" alt="" width="80" height="80" style="display: block; margin: 0 auto; border-radius: 6px;">
                         </td>'''
-    
-    # Count coordination requirements
-    coord_count = sum(1 for r in recommendation.releases if r.requires_coordination)
-    
-    # Build appropriate greeting based on recipient role
-    owner_name = recommendation.owner_email.split('@')[0]
-    
-    # Check if there are other symlink owners (coordination needed)
-    has_symlink_owners = len(recommendation.all_symlink_owners) > 0
-    
-    if has_symlink_owners:
-        # This email is going to release owner AND symlink owners (CC'd)
-        greeting_text = f'''
+
+_EMAIL_GREETING_WITH_SYMLINK_OWNERS = '''
             <p style="margin: 0; font-size: 22px; color: #212529; font-weight: bold;">
                 Hello <strong>{owner_name}</strong> (Release Owner) and <strong>Symlink Owners</strong> (CC'd),
             </p>
             <p style="margin: 10px 0 20px 0; font-size: 22px; color: #212529;">
-                <strong>{owner_name}</strong>: You have <strong>{recommendation.release_count}</strong> old releases consuming <strong>{recommendation.total_size_human}</strong>. 
+                <strong>{owner_name}</strong>: You have <strong>{release_count}</strong> old releases consuming <strong>{total_size_human}</strong>. 
                 <strong style="color: #dc3545;">DELETE THEM</strong> to free up space.<br/>
                 <strong>Symlink Owners (CC'd)</strong>: Remove your symlinks FIRST before {owner_name} deletes the releases.
             </p>'''
-    else:
-        # Only release owner, no coordination needed
-        greeting_text = f'''
+
+_EMAIL_GREETING = '''
             <p style="margin: 0; font-size: 22px; color: #212529; font-weight: bold;">
                 Hello <strong>{owner_name}</strong>,
             </p>
             <p style="margin: 10px 0 20px 0; font-size: 22px; color: #212529;">
-                You have <strong>{recommendation.release_count}</strong> old releases consuming <strong>{recommendation.total_size_human}</strong>. 
+                You have <strong>{release_count}</strong> old releases consuming <strong>{total_size_human}</strong>. 
                 <strong style="color: #dc3545;">DELETE THEM</strong> to free up space.
             </p>'''
-    
-    # Build header
-    if coord_count > 0:
-        title_text = "Block Release Cleanup - Coordination Required"
-        desc_text = f"⚠️ {coord_count} release(s) require coordination with other users"
-        header_color = "#ff9800"  # Orange for coordination
-    else:
-        title_text = "Block Release Cleanup Required"
-        desc_text = "AGUR Release Area at 90% - Action Required"
-        header_color = "#dc3545"  # Red for critical
-    
-    test_banner = ''
-    if test_mode:
-        test_banner = '''
+
+_EMAIL_TEST_BANNER = '''
         <div style="background-color: #ff9800; color: white; padding: 10px; text-align: center; font-weight: bold;">
             [TEST MODE] This email would normally be sent to the release owner
         </div>'''
-    
-    # Build simplified release table (removed Status column)
-    release_rows = ''
-    for release in sorted(recommendation.releases, key=lambda r: r.size_bytes, reverse=True):
-        # Build symlink info
-        symlink_cell = 'None'
-        if release.symlink_infos:
-            symlink_list = []
-            for sym in release.symlink_infos:
-                owner_badge = f" ({sym.symlink_owner})" if sym.symlink_owner != release.owner else ""
-                symlink_list.append(f"{sym.symlink_name}{owner_badge}")
-            symlink_cell = '<br/>'.join(symlink_list)
-        
-        release_rows += f'''
+
+_EMAIL_RELEASE_ROW = '''
             <tr>
-                <td style="padding: 10px; border-bottom: 1px solid #dee2e6; font-size: 16px;">{release.unit}</td>
-                <td style="padding: 10px; border-bottom: 1px solid #dee2e6; font-size: 16px; font-family: monospace; word-break: break-all;">{release.release_dir}</td>
-                <td style="padding: 10px; border-bottom: 1px solid #dee2e6; text-align: center; font-size: 16px;">{release.age_days}d</td>
-                <td style="padding: 10px; border-bottom: 1px solid #dee2e6; text-align: right; font-weight: bold; font-size: 16px;">{release.size_human}</td>
+                <td style="padding: 10px; border-bottom: 1px solid #dee2e6; font-size: 16px;">{unit}</td>
+                <td style="padding: 10px; border-bottom: 1px solid #dee2e6; font-size: 16px; font-family: monospace; word-break: break-all;">{release_dir}</td>
+                <td style="padding: 10px; border-bottom: 1px solid #dee2e6; text-align: center; font-size: 16px;">{age_days}d</td>
+                <td style="padding: 10px; border-bottom: 1px solid #dee2e6; text-align: right; font-weight: bold; font-size: 16px;">{size_human}</td>
                 <td style="padding: 10px; border-bottom: 1px solid #dee2e6; font-size: 16px;">{symlink_cell}</td>
             </tr>'''
-    
-    # Build coordination section - action-oriented
-    coordination_section = ''
-    if coord_count > 0:
-        coord_releases = [r for r in recommendation.releases if r.requires_coordination]
-        coordination_section = '''
+
+_EMAIL_COORDINATION_HEADER = '''
         <div style="background-color: #fff3cd; border-left: 4px solid #ff9800; padding: 15px; margin: 15px 0;">
             <p style="margin: 0 0 10px 0; font-weight: bold; color: #856404; font-size: 24px;">
                 ⚠️ ⚠️ COORDINATION REQUIRED ⚠️ ⚠️
@@ -2115,45 +1335,24 @@ def build_email_html(recommendation: OwnerRecommendation, test_mode: bool = Fals
                     <th style="padding: 8px; text-align: left; font-size: 17px; font-weight: bold;">Other User</th>
                     <th style="padding: 8px; text-align: left; font-size: 17px; font-weight: bold;">Their Symlink</th>
                 </tr>'''
-        
-        for release in coord_releases:
-            for symlink_info in release.symlink_infos:
-                if symlink_info.symlink_owner != release.owner:
-                    coordination_section += f'''
+
+_EMAIL_COORDINATION_ROW = '''
                 <tr>
-                    <td style="padding: 8px; border-bottom: 1px solid #dee2e6; font-size: 16px; font-family: monospace; word-break: break-all;">{release.unit}/{release.release_dir}</td>
-                    <td style="padding: 8px; border-bottom: 1px solid #dee2e6; font-size: 16px;"><strong>{symlink_info.symlink_owner}</strong></td>
-                    <td style="padding: 8px; border-bottom: 1px solid #dee2e6; font-size: 16px; font-family: monospace;">{symlink_info.symlink_name}</td>
+                    <td style="padding: 8px; border-bottom: 1px solid #dee2e6; font-size: 16px; font-family: monospace; word-break: break-all;">{unit}/{release_dir}</td>
+                    <td style="padding: 8px; border-bottom: 1px solid #dee2e6; font-size: 16px;"><strong>{symlink_owner}</strong></td>
+                    <td style="padding: 8px; border-bottom: 1px solid #dee2e6; font-size: 16px; font-family: monospace;">{symlink_name}</td>
                 </tr>'''
-        
-        coordination_section += '''
+
+_EMAIL_COORDINATION_FOOTER = '''
             </table>
         </div>'''
-    
-    # Build per-release commands - only owner's own symlinks
-    commands_list = ''
-    for i, release in enumerate(sorted(recommendation.releases, key=lambda r: r.size_bytes, reverse=True), 1):
-        # Only include symlinks owned by the release owner
-        owner_symlinks = [s for s in release.symlink_infos if s.symlink_owner == release.owner]
-        
-        symlink_commands = ''
-        if owner_symlinks:
-            symlink_commands = '<p style="margin: 5px 0; color: #856404; font-size: 18px;"><strong>Step 1: Remove your symlinks</strong></p>\n'
-            for sym in owner_symlinks:
-                symlink_commands += f'<pre style="background: #263238; color: #ffc107; padding: 8px; border-radius: 4px; margin: 3px 0; font-size: 15px;">rm {sym.symlink_path}</pre>\n'
-        
-        # Verification command
-        verify_cmd = f'find /home/agur_backend_blockRelease/block/{release.unit}/ -type l -exec ls -l {{}} \\; | grep "{release.release_dir}"'
-        
-        # Deletion command
-        delete_cmd = f'rm -rf {release.full_path}'
-        
-        step_num_verify = 2 if owner_symlinks else 1
-        step_num_delete = 3 if owner_symlinks else 2
-        
-        commands_list += f'''
+
+_EMAIL_SYMLINKS_STEP = '<p style="margin: 5px 0; color: #856404; font-size: 18px;"><strong>Step 1: Remove your symlinks</strong></p>\n'
+_EMAIL_SYMLINK_RM = '<pre style="background: #263238; color: #ffc107; padding: 8px; border-radius: 4px; margin: 3px 0; font-size: 15px;">rm {}</pre>\n'
+
+_EMAIL_COMMANDS_BLOCK = '''
         <div style="background-color: #f8f9fa; border-left: 3px solid #0d47a1; padding: 12px; margin: 10px 0;">
-            <p style="margin: 0 0 8px 0; font-weight: bold; color: #0d47a1; font-size: 18px;">Release {i}: {release.unit}/{release.release_dir} ({release.size_human})</p>
+            <p style="margin: 0 0 8px 0; font-weight: bold; color: #0d47a1; font-size: 18px;">Release {i}: {unit}/{release_dir} ({size_human})</p>
             
             {symlink_commands}
             
@@ -2164,144 +1363,241 @@ def build_email_html(recommendation: OwnerRecommendation, test_mode: bool = Fals
             <p style="margin: 10px 0 5px 0; font-size: 18px;"><strong>Step {step_num_delete}: Delete the release</strong></p>
             <pre style="background: #263238; color: #f48fb1; padding: 8px; border-radius: 4px; margin: 3px 0; font-size: 15px;">{delete_cmd}</pre>
         </div>'''
+
+@functools.lru_cache(maxsize=4096)
+def _render_release_row(unit: str, release_dir: str, age_days: int, size_human: str,
+                        symlink_labels: Tuple[str, ...]) -> str:
+    """
+    Render one row of the email release table (cached - resends and digests
+    repeat the same releases)
     
-    # Build full HTML
-    html = f'''<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-</head>
-<body style="font-family: Arial, sans-serif; background-color: #f5f5f5; margin: 0; padding: 20px;">
-    {test_banner}
-    <div style="max-width: 1000px; margin: 0 auto; background: white; border-radius: 8px; box-shadow: 0 4px 6px rgba(0,0,0,0.1); overflow: hidden;">
-        
-        <!-- Header (Keep as-is) -->
-        <table width="100%" cellpadding="0" cellspacing="0" border="0" style="background-color: {header_color};">
-            <tr>{logo_cell}
-                <td style="padding: 15px 20px; vertical-align: middle;">
-                    <span style="color: white; font-size: 22px; font-weight: bold; display: block;">{title_text}</span>
-                    <span style="color: white; font-size: 18px;">{desc_text}</span>
-                </td>
-                <td style="width: 300px; text-align: right; vertical-align: middle; padding: 10px 15px;">
-                    <table cellpadding="0" cellspacing="0" border="0" align="right">
-                        <tr>
-                            <td style="background-color: #fff; border: 3px solid #fff; border-radius: 6px; padding: 10px 20px; text-align: center;">
-                                <span style="color: {header_color}; font-size: 32px; font-weight: bold; display: block; line-height: 1;">{recommendation.release_count}</span>
-                                <span style="color: #666; font-size: 13px; display: block; margin-top: 3px;">OLD RELEASES</span>
-                            </td>
-                            <td style="width: 10px;"></td>
-                            <td style="background-color: #fff; border: 3px solid #fff; border-radius: 6px; padding: 10px 20px; text-align: center;">
-                                <span style="color: {header_color}; font-size: 32px; font-weight: bold; display: block; line-height: 1;">{recommendation.total_size_human}</span>
-                                <span style="color: #666; font-size: 13px; display: block; margin-top: 3px;">RECLAIMABLE</span>
-                            </td>
-                        </tr>
-                    </table>
-                </td>
-            </tr>
-        </table>
+    Args:
+        unit: Unit name
+        release_dir: Release directory name
+        age_days: Release age in days
+        size_human: Human-readable release size
+        symlink_labels: Symlink names, suffixed with the owner when not the release owner
+    
+    Returns:
+        Escaped <tr> HTML fragment
+    """
+    # Names/owners come from the filesystem - escape them
+    symlink_cell = '<br/>'.join([escape(label) for label in symlink_labels]) if symlink_labels else 'None'
+    return _EMAIL_RELEASE_ROW.format(
+        unit=escape(unit), release_dir=escape(release_dir),
+        age_days=age_days, size_human=size_human, symlink_cell=symlink_cell)
+
+@functools.lru_cache(maxsize=4096)
+def _render_release_commands(i: int, unit: str, release_dir: str, size_human: str, full_path: str,
+                             owner_symlink_paths: Tuple[str, ...]) -> str:
+    """
+    Render the per-release verify/delete command block (cached like _render_release_row)
+    
+    Args:
+        i: 1-based position of the release in the email
+        unit: Unit name
+        release_dir: Release directory name
+        size_human: Human-readable release size
+        full_path: Absolute release path for the delete command
+        owner_symlink_paths: Paths of symlinks the release owner must remove first
+    
+    Returns:
+        Escaped HTML fragment
+    """
+    symlink_commands = ''
+    if owner_symlink_paths:
+        symlink_commands = _EMAIL_SYMLINKS_STEP + ''.join(
+            [_EMAIL_SYMLINK_RM.format(escape(path)) for path in owner_symlink_paths])
+    
+    # Verification command
+    verify_cmd = f'find /home/agur_backend_blockRelease/block/{unit}/ -type l -exec ls -l {{}} \\; | grep "{release_dir}"'
+    
+    # Deletion command
+    delete_cmd = f'rm -rf {full_path}'
+    
+    return _EMAIL_COMMANDS_BLOCK.format(
+        i=i, unit=escape(unit), release_dir=escape(release_dir),
+        size_human=size_human, symlink_commands=symlink_commands,
+        step_num_verify=2 if owner_symlink_paths else 1, verify_cmd=escape(verify_cmd),
+        step_num_delete=3 if owner_symlink_paths else 2, delete_cmd=escape(delete_cmd))
+
+def build_email_html(recommendation: OwnerRecommendation, test_mode: bool = False) -> str:
+    """
+    Build HTML email for cleanup recommendations.
+    
+    Args:
+        recommendation: OwnerRecommendation object
+        test_mode: If True, add test mode banner
         
-        <!-- Content -->
-        <div style="padding: 20px;">
-            <!-- Greeting - Addresses both release owner and symlink owners -->
-            {greeting_text}
-            
-            {coordination_section}
-            
-            <!-- Release Table - Simplified (no Status column) -->
-            <h3 style="color: #0d47a1; margin: 20px 0 10px 0; font-size: 26px; font-weight: bold;">📋 Your Old Releases</h3>
-            <table style="width: 100%; border-collapse: collapse; margin: 15px 0;">
-                <tr style="background-color: #f8f9fa;">
-                    <th style="padding: 10px; text-align: left; border-bottom: 2px solid #dee2e6; font-size: 17px; font-weight: bold;">Unit</th>
-                    <th style="padding: 10px; text-align: left; border-bottom: 2px solid #dee2e6; font-size: 17px; font-weight: bold;">Release Directory</th>
-                    <th style="padding: 10px; text-align: center; border-bottom: 2px solid #dee2e6; font-size: 17px; font-weight: bold;">Age</th>
-                    <th style="padding: 10px; text-align: right; border-bottom: 2px solid #dee2e6; font-size: 17px; font-weight: bold;">Size</th>
-                    <th style="padding: 10px; text-align: left; border-bottom: 2px solid #dee2e6; font-size: 17px; font-weight: bold;">Symlinks</th>
-                </tr>
-                {release_rows}
-            </table>
-            
-            <!-- Commands - Per Release -->
-            <h3 style="color: #0d47a1; margin: 20px 0 10px 0; font-size: 26px; font-weight: bold;">⚠️ DELETION COMMANDS - YOU MUST RUN THESE ⚠️</h3>
-            {commands_list}
-            
-            <!-- Acknowledgment Request -->
-            <div style="background: #fff3cd; border: 3px solid #ff9800; padding: 20px; margin: 20px 0; border-radius: 4px; text-align: center;">
-                <p style="margin: 0 0 10px 0; font-weight: bold; color: #856404; font-size: 24px;">
-                    ⚠️ REPLY REQUIRED ⚠️
-                </p>
-                <p style="margin: 0; font-weight: bold; color: #856404; font-size: 20px;">
-                    📧 You MUST reply to this email after deleting.
-                </p>
-            </div>
-            
-            <!-- Contact Info -->
-            <p style="text-align: center; color: #666; font-size: 16px; margin: 10px 0;">
-                Questions? Contact {ALWAYS_CC} or {recommendation.chiplet_manager}
-            </p>
-        </div>
-    </div>
-</body>
-</html>'''
+    Returns:
+        HTML string for email body
+    """
+    logo_data = load_logo_base64()
+    
+    # Count coordination requirements
+    coord_count = sum(1 for r in recommendation.releases if r.requires_coordination)
+    
+    # Build appropriate greeting based on recipient role
+    owner_name = recommendation.owner_email.split('@')[0]
+    
+    # Check if there are other symlink owners (coordination needed) - if so the
+    # email goes to the release owner AND the symlink owners (CC'd)
+    has_symlink_owners = len(recommendation.all_symlink_owners) > 0
+    greeting_template = _EMAIL_GREETING_WITH_SYMLINK_OWNERS if has_symlink_owners else _EMAIL_GREETING
+    
+    # Build header
+    if coord_count > 0:
+        title_text = "Block Release Cleanup - Coordination Required"
+        desc_text = f"⚠️ {coord_count} release(s) require coordination with other users"
+        header_color = "#ff9800"  # Orange for coordination
+    else:
+        title_text = "Block Release Cleanup Required"
+        desc_text = "AGUR Release Area at 90% - Action Required"
+        header_color = "#dc3545"  # Red for critical
+    
+    releases_by_size = sorted(recommendation.releases, key=_SIZE_KEY, reverse=True)
+    
+    # Build simplified release table (removed Status column)
+    release_rows = [
+        _render_release_row(
+            release.unit, release.release_dir, release.age_days, release.size_human,
+            tuple([f"{sym.symlink_name} ({sym.symlink_owner})" if sym.symlink_owner != release.owner
+                   else sym.symlink_name
+                   for sym in release.symlink_infos]))
+        for release in releases_by_size
+    ]
+    
+    # Build coordination section - action-oriented
+    coordination_section = ''
+    if coord_count > 0:
+        coordination_section = ''.join([
+            _EMAIL_COORDINATION_HEADER,
+            *[_EMAIL_COORDINATION_ROW.format(
+                unit=escape(release.unit), release_dir=escape(release.release_dir),
+                symlink_owner=escape(symlink_info.symlink_owner),
+                symlink_name=escape(symlink_info.symlink_name))
+              for release in recommendation.releases if release.requires_coordination
+              for symlink_info in release.symlink_infos
+              if symlink_info.symlink_owner != release.owner],
+            _EMAIL_COORDINATION_FOOTER,
+        ])
+    
+    # Build per-release commands - only owner's own symlinks
+    commands_list = [
+        _render_release_commands(
+            i, release.unit, release.release_dir, release.size_human, release.full_path,
+            tuple([s.symlink_path for s in release.symlink_infos if s.symlink_owner == release.owner]))
+        for i, release in enumerate(releases_by_size, 1)
+    ]
+    
+    # Fill the precompiled page template - fragments above are already escaped
+    return _get_template('email.html.j2').render(
+        test_banner=Markup(_EMAIL_TEST_BANNER) if test_mode else '',
+        header_color=header_color,
+        logo_cell=Markup(_EMAIL_LOGO_CELL.format(logo_data=logo_data)) if logo_data else '',
+        title_text=title_text,
+        desc_text=desc_text,
+        release_count=recommendation.release_count,
+        total_size_human=recommendation.total_size_human,
+        greeting_text=Markup(greeting_template.format(
+            owner_name=owner_name, release_count=recommendation.release_count,
+            total_size_human=recommendation.total_size_human)),
+        coordination_section=Markup(coordination_section),
+        release_rows=Markup(''.join(release_rows)),
+        commands_list=Markup(''.join(commands_list)),
+        always_cc=ALWAYS_CC,
+        chiplet_manager=recommendation.chiplet_manager,
+    )
+
+# Per-message subject lines; the From header and MIME envelope are the same for every owner
+_EMAIL_SUBJECT = '[AGUR] Release Cleanup Required - {} Can Be Freed'
+_EMAIL_SUBJECT_TEST = '[TEST] [AGUR] Release Cleanup - {} Can Be Freed'
+
+def build_cleanup_message(recommendation: OwnerRecommendation,
+                          test_mode: bool = False) -> Tuple[MIMEMultipart, List[str]]:
+    """
+    Build the cleanup email for an owner, CC'ing symlink owners and managers.
+    
+    Args:
+        recommendation: OwnerRecommendation object
+        test_mode: If True, address the email to the current user only
+        
+    Returns:
+        Tuple of (message, recipients) - recipients is [To] + CC list
+    """
+    # Build recipient lists
+    if test_mode:
+        to_address = get_test_mode_recipient()
+        cc_list = []
+        subject = _EMAIL_SUBJECT_TEST.format(recommendation.total_size_human)
+    else:
+        to_address = recommendation.owner_email
+        cc_list = [ALWAYS_CC, recommendation.chiplet_manager]
+        
+        # Add backup manager for QNS/TCB chiplets (flag set when the recommendation was built)
+        if recommendation.needs_backup_manager_cc:
+            cc_list.append(BACKUP_MANAGER)
+        
+        # Add log owners (previous owners) and symlink owners to CC - both are
+        # sets, so order them for a stable header
+        cc_list.extend(sorted(recommendation.cc_log_owners | recommendation.all_symlink_owners))
+        
+        # Remove duplicates, keeping managers first
+        cc_list = list(dict.fromkeys(cc_list))
+        
+        subject = _EMAIL_SUBJECT.format(recommendation.total_size_human)
     
-    return html
+    msg = MIMEMultipart('alternative')
+    msg['Subject'] = subject
+    msg['From'] = ALWAYS_CC
+    msg['To'] = to_address
+    if cc_list:
+        msg['Cc'] = ', '.join(cc_list)
+    
+    # Build HTML body
+    msg.attach(MIMEText(build_email_html(recommendation, test_mode), 'html'))
+    
+    return msg, [to_address] + cc_list
 
-def send_cleanup_email(recommendation: OwnerRecommendation, test_mode: bool = False) -> bool:
+def send_cleanup_email(recommendation: OwnerRecommendation, test_mode: bool = False,
+                       smtp_state: Optional[Dict] = None,
+                       message: Optional[Tuple[MIMEMultipart, List[str]]] = None) -> bool:
     """
     Send cleanup recommendation email to owner with CC to symlink owners and manager.
     
     Args:
         recommendation: OwnerRecommendation object
         test_mode: If True, send to current user only
+        smtp_state: Batch connection state from _get_smtp() to send on (the connection
+                    is replaced once if the server dropped it). If None, a connection
+                    is opened for this email only.
+        message: Prebuilt build_cleanup_message() result, built here if None
         
     Returns:
         True if successful, False otherwise
     """
     try:
-        msg = MIMEMultipart('alternative')
-        
-        # Build recipient lists
-        if test_mode:
-            to_address = get_test_mode_recipient()
-            cc_list = []
-            msg['Subject'] = f'[TEST] [AGUR] Release Cleanup - {recommendation.total_size_human} Can Be Freed'
-        else:
-            to_address = recommendation.owner_email
-            cc_list = [ALWAYS_CC, recommendation.chiplet_manager]
-            
-            # Add backup manager for QNS/TCB chiplets (temporary - ohamama on vacation)
-            chiplets_in_recommendation = set(r.chiplet for r in recommendation.releases)
-            if 'QNS' in chiplets_in_recommendation or 'TCB' in chiplets_in_recommendation:
-                cc_list.append('vliberchuk@nvidia.com')
-            
-            # Add log owners (previous owners) to CC
-            cc_list.extend(recommendation.cc_log_owners)
-            
-            # Add symlink owners to CC if coordination required
-            cc_list.extend(recommendation.all_symlink_owners)
-            
-            # Remove duplicates and sort
-            cc_list = sorted(set(cc_list))
-            
-            msg['Subject'] = f'[AGUR] Release Cleanup Required - {recommendation.total_size_human} Can Be Freed'
-        
-        msg['From'] = ALWAYS_CC
-        msg['To'] = to_address
-        if cc_list:
-            msg['Cc'] = ', '.join(cc_list)
-        
-        # Build HTML body
-        html_body = build_email_html(recommendation, test_mode)
-        msg.attach(MIMEText(html_body, 'html'))
+        if message is None:
+            message = build_cleanup_message(recommendation, test_mode)
+        msg, all_recipients = message
         
         # Send email
-        all_recipients = [to_address] + cc_list
-        with smtplib.SMTP('localhost') as smtp:
-            smtp.send_message(msg, to_addrs=all_recipients)
+        if smtp_state is None:
+            with smtplib.SMTP(SMTP_HOST) as conn:
+                conn.send_message(msg, to_addrs=all_recipients)
+        else:
+            try:
+                _get_smtp(smtp_state).send_message(msg, to_addrs=all_recipients)
+            except (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError):
+                # Shared session went away - replace it (resets its message count) and retry once
+                logger.warning(f"  SMTP connection lost, reconnecting to {SMTP_HOST}")
+                _close_smtp(smtp_state)
+                _get_smtp(smtp_state).send_message(msg, to_addrs=all_recipients)
         
         if test_mode:
-            logger.info(f"  [TEST] Sent to {to_address} (originally for {recommendation.owner_email})")
+            logger.info(f"  [TEST] Sent to {all_recipients[0]} (originally for {recommendation.owner_email})")
         else:
-            logger.info(f"  Sent to {to_address} (CC: {len(cc_list)} recipients)")
+            logger.info(f"  Sent to {all_recipients[0]} (CC: {len(all_recipients) - 1} recipients)")
         
         return True
         
@@ -2309,6 +1605,38 @@ def send_cleanup_email(recommendation: OwnerRecommendation, test_mode: bool = Fa
         logger.error(f"  Failed to send email to {recommendation.owner_email}: {e}")
         return False
 
+def _get_smtp(state: Dict) -> smtplib.SMTP:
+    """
+    Return the batch SMTP connection, opening it lazily and cycling it
+    once MAX_EMAILS_PER_CONNECTION messages have gone through it
+    
+    Args:
+        state: Mutable dict holding 'smtp' (connection or None) and 'sent_on_conn'
+    
+    Returns:
+        Connected smtplib.SMTP instance
+    """
+    smtp = state.get('smtp')
+    if smtp is not None and state['sent_on_conn'] >= MAX_EMAILS_PER_CONNECTION:
+        logger.debug(f"  Cycling SMTP connection after {state['sent_on_conn']} messages")
+        _close_smtp(state)
+        smtp = None
+    if smtp is None:
+        smtp = smtplib.SMTP(SMTP_HOST)
+        state['smtp'] = smtp
+        state['sent_on_conn'] = 0
+    return smtp
+
+def _close_smtp(state: Dict):
+    """Politely close the batch SMTP connection held in state, if any"""
+    smtp = state.pop('smtp', None)
+    if smtp is None:
+        return
+    try:
+        smtp.quit()
+    except (OSError, smtplib.SMTPException):
+        smtp.close()
+
 def send_cleanup_emails(owner_recommendations: Dict[str, OwnerRecommendation], 
                         test_mode: bool = False,
                         approved_releases_set: Set[str] = None):
@@ -2323,9 +1651,8 @@ def send_cleanup_emails(owner_recommendations: Dict[str, OwnerRecommendation],
     """
     logger.info("\nSending cleanup recommendation emails...")
     
-    sent_count = 0
-    failed_count = 0
-    
+    # Collect the recommendations to send first
+    to_send = []
     for owner_email, recommendation in owner_recommendations.items():
         # Filter recommendation if approved_releases_set is provided
         if approved_releases_set is not None:
@@ -2338,27 +1665,90 @@ def send_cleanup_emails(owner_recommendations: Dict[str, OwnerRecommendation],
                 continue
             
             # Create filtered recommendation with all required fields
-            filtered_recommendation = OwnerRecommendation(
+            recommendation = OwnerRecommendation(
                 owner_email=recommendation.owner_email,
                 releases=approved_releases,
                 total_size_bytes=sum(r.size_bytes for r in approved_releases),
                 total_size_human=format_bytes(sum(r.size_bytes for r in approved_releases)),
-                unit_count=len(set(r.unit for r in approved_releases)),
+                unit_count=len({r.unit for r in approved_releases}),
                 release_count=len(approved_releases),
                 chiplet_manager=recommendation.chiplet_manager,
-                all_symlink_owners=recommendation.all_symlink_owners
+                needs_backup_manager_cc=any(r.chiplet in BACKUP_MANAGER_CHIPLETS for r in approved_releases)
             )
+        # else: send for all releases (original behavior)
+        to_send.append(recommendation)
+    
+    sent_count = 0
+    failed_count = 0
+    
+    if to_send:
+        # Small pool of SMTP sessions shared by the sender threads; each session
+        # connects lazily and is cycled every MAX_EMAILS_PER_CONNECTION messages
+        pool_size = min(SMTP_POOL_SIZE, len(to_send))
+        conn_pool = queue.Queue()
+        for _ in range(pool_size):
+            conn_pool.put({'smtp': None, 'sent_on_conn': 0})
+        
+        counter_lock = Lock()
+        abort = Event()
+        attempted = 0
+        connect_failed = False
+        
+        def record_result(success: bool):
+            nonlocal sent_count, failed_count, attempted
+            with counter_lock:
+                attempted += 1
+                if success:
+                    sent_count += 1
+                else:
+                    failed_count += 1
+                if (not abort.is_set() and attempted >= EMAIL_ABORT_MIN_ATTEMPTS
+                        and failed_count * 3 > attempted):
+                    logger.error(f"  Aborting: {failed_count} of {attempted} emails failed "
+                                 f"({len(to_send) - attempted} not attempted)")
+                    abort.set()
+        
+        def send_one(recommendation: OwnerRecommendation):
+            nonlocal connect_failed
+            if abort.is_set():
+                return
+            
+            # Render the message before taking a connection, so template work
+            # overlaps with the other workers' network I/O
+            try:
+                message = build_cleanup_message(recommendation, test_mode)
+            except Exception as e:
+                logger.error(f"  Failed to build email for {recommendation.owner_email}: {e}")
+                record_result(False)
+                return
             
-            if send_cleanup_email(filtered_recommendation, test_mode):
-                sent_count += 1
-            else:
-                failed_count += 1
-        else:
-            # Send for all releases (original behavior)
-            if send_cleanup_email(recommendation, test_mode):
-                sent_count += 1
-            else:
-                failed_count += 1
+            state = conn_pool.get()
+            try:
+                try:
+                    _get_smtp(state)
+                except (OSError, smtplib.SMTPException) as e:
+                    with counter_lock:
+                        if not connect_failed:
+                            logger.error(f"  SMTP connection to {SMTP_HOST} failed: {e}")
+                        connect_failed = True
+                    abort.set()
+                    return
+                success = send_cleanup_email(recommendation, test_mode, smtp_state=state, message=message)
+                state['sent_on_conn'] += 1
+            finally:
+                conn_pool.put(state)
+            
+            record_result(success)
+        
+        try:
+            with ThreadPoolExecutor(max_workers=pool_size) as executor:
+                list(executor.map(send_one, to_send))
+        finally:
+            while not conn_pool.empty():
+                _close_smtp(conn_pool.get_nowait())
+        
+        if connect_failed:
+            failed_count = len(to_send) - sent_count
     
     logger.info(f"  Emails sent: {sent_count}, Failed: {failed_count}")
 
@@ -2375,17 +1765,24 @@ def generate_reports(owner_recommendations: Dict[str, OwnerRecommendation],
     
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     
-    # Generate detailed CSV report
     csv_file = output_path / f"cleanup_report_{timestamp}.csv"
-    generate_csv_report(releases, csv_file)
-    
-    # Generate unit summary CSV report
     unit_summary_file = output_path / f"cleanup_unit_summary_{timestamp}.html"
-    generate_dashboard_report(releases, unit_summary_file)
-    
-    # Generate Markdown summary
     md_file = output_path / f"cleanup_summary_{timestamp}.md"
-    generate_markdown_summary(owner_recommendations, releases, md_file, age_threshold)
+    
+    # One pass over the releases feeds both the dashboard and the Markdown summary
+    stats = calculate_release_stats(releases, 10)
+    
+    # The reports only read the releases, so the detailed CSV, the dashboard
+    # and the Markdown summary are written concurrently
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [
+            executor.submit(generate_csv_report, releases, csv_file),
+            executor.submit(generate_dashboard_report, releases, unit_summary_file, stats),
+            executor.submit(generate_markdown_summary, owner_recommendations, releases, md_file,
+                            age_threshold, stats),
+        ]
+        for future in futures:
+            future.result()  # Re-raise any report failure
     
     logger.info(f"  Reports written to {output_path}/")
 
@@ -2404,7 +1801,7 @@ def group_releases_by_owner(releases: List[ReleaseInfo]) -> Dict[str, OwnerRecom
     owner_map = {}
     
     for release in releases:
-        owner_email = f"{release.owner}@nvidia.com"
+        owner_email = email_of(release.owner)
         
         if owner_email not in owner_map:
             # Get chiplet manager
@@ -2417,27 +1814,19 @@ def group_releases_by_owner(releases: List[ReleaseInfo]) -> Dict[str, OwnerRecom
                 total_size_human='',
                 unit_count=0,
                 release_count=0,
-                chiplet_manager=chiplet_manager,
-                all_symlink_owners=set()
+                chiplet_manager=chiplet_manager
             )
         
         recommendation = owner_map[owner_email]
         recommendation.releases.append(release)
+        if release.chiplet in BACKUP_MANAGER_CHIPLETS:
+            recommendation.needs_backup_manager_cc = True
         recommendation.total_size_bytes += release.size_bytes
         recommendation.release_count += 1
-        
-        # Collect symlink owners for coordination
-        for symlink_info in release.symlink_infos:
-            if symlink_info.symlink_owner != release.owner:
-                recommendation.all_symlink_owners.add(f"{symlink_info.symlink_owner}@nvidia.com")
-        
-        # Collect log owners (previous owners) for CC if different from current folder owner
-        if release.log_owner and release.log_owner != release.folder_owner:
-            recommendation.cc_log_owners.add(f"{release.log_owner}@nvidia.com")
     
     # Calculate unique units and format sizes
     for owner_email, recommendation in owner_map.items():
-        unique_units = set(r.unit for r in recommendation.releases)
+        unique_units = {r.unit for r in recommendation.releases}
         recommendation.unit_count = len(unique_units)
         recommendation.total_size_human = format_bytes(recommendation.total_size_bytes)
         
@@ -2446,125 +1835,130 @@ def group_releases_by_owner(releases: List[ReleaseInfo]) -> Dict[str, OwnerRecom
     
     return owner_map
 
+# (suffix, divisor) per power of 1024, indexed by format_bytes via bit_length
+_BYTE_UNITS = (('B', 1), ('KB', 1 << 10), ('MB', 1 << 20), ('GB', 1 << 30), ('TB', 1 << 40), ('PB', 1 << 50))
+
+@functools.lru_cache(maxsize=4096)
 def format_bytes(bytes_val: int) -> str:
-    """Format bytes to human readable string"""
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if bytes_val < 1024.0:
-            return f"{bytes_val:.1f}{unit}"
-        bytes_val /= 1024.0
-    return f"{bytes_val:.1f}PB"
-
-def calculate_age_distribution(releases: List[ReleaseInfo]) -> Dict:
-    """Calculate age distribution buckets"""
-    buckets = {
-        '0-30d': 0,
-        '30-60d': 0,
-        '60-90d': 0,
-        '90-180d': 0,
-        '180+d': 0
-    }
-    
-    for release in releases:
-        age = release.age_days
-        if age <= 30:
-            buckets['0-30d'] += 1
-        elif age <= 60:
-            buckets['30-60d'] += 1
-        elif age <= 90:
-            buckets['60-90d'] += 1
-        elif age <= 180:
-            buckets['90-180d'] += 1
-        else:
-            buckets['180+d'] += 1
-    
-    return buckets
+    """Format bytes to human readable string (cached - totals repeat across tables)"""
+    if bytes_val < 1024:
+        return f"{bytes_val:.1f}B"
+    # Each unit spans 10 bits, so the unit index comes straight from the bit length
+    unit, divisor = _BYTE_UNITS[min((int(bytes_val).bit_length() - 1) // 10, len(_BYTE_UNITS) - 1)]
+    return f"{bytes_val / divisor:.1f}{unit}"
 
-def calculate_chiplet_breakdown(releases: List[ReleaseInfo]) -> Dict:
-    """Calculate size breakdown by chiplet"""
-    chiplet_data = {}
-    
-    for release in releases:
-        if release.chiplet not in chiplet_data:
-            chiplet_data[release.chiplet] = {
-                'size_bytes': 0,
-                'count': 0
-            }
-        chiplet_data[release.chiplet]['size_bytes'] += release.size_bytes
-        chiplet_data[release.chiplet]['count'] += 1
-    
-    return chiplet_data
+# Age bucket upper bounds (inclusive) and labels - bisect_left maps an age to its bucket
+_AGE_BUCKET_BOUNDS = (30, 60, 90, 180)
+_AGE_BUCKET_LABELS = ('0-30d', '30-60d', '60-90d', '90-180d', '180+d')
 
-def calculate_coordination_stats(releases: List[ReleaseInfo]) -> Dict:
-    """Calculate coordination statistics"""
-    stats = {
+def calculate_release_stats(releases: List[ReleaseInfo], top_limit: int = 10) -> Dict:
+    """
+    Calculate all dashboard metrics in a single pass over the releases.
+    
+    Args:
+        releases: List of ReleaseInfo objects
+        top_limit: Number of top space consumers to return
+        
+    Returns:
+        Dict with keys:
+          'age_distribution'  - release count per age bucket
+          'chiplet_breakdown' - chiplet -> {'size_bytes', 'count'}
+          'unit_breakdown'    - (chiplet, unit) -> {'size_bytes', 'count'}
+          'coordination'      - no_symlinks / self_symlinks / coordination_needed counts
+          'top_consumers'     - top (unit, owner) pairs by size
+          'unit_owner_summary' - (unit, owner) -> {'unit', 'owner', 'chiplet', 'count', 'size_bytes'}
+          'owner_groups'      - owner -> {'releases', 'units', 'chiplets', 'total_size'}
+                                (units and chiplets as sorted, de-duplicated lists)
+    """
+    age_counts = [0] * len(_AGE_BUCKET_LABELS)
+    coord_stats = {
         'no_symlinks': 0,
         'self_symlinks': 0,
         'coordination_needed': 0
     }
+    chiplet_data = {}
+    unit_data = {}
+    consumer_map = {}
+    owner_groups = {}
     
     for release in releases:
+        chiplet = release.chiplet
+        unit = release.unit
+        owner = release.owner
+        size_bytes = release.size_bytes
+        
+        # Age distribution
+        age_counts[bisect_left(_AGE_BUCKET_BOUNDS, release.age_days)] += 1
+        
+        # Coordination statistics
         if not release.has_symlinks:
-            stats['no_symlinks'] += 1
+            coord_stats['no_symlinks'] += 1
         elif release.requires_coordination:
-            stats['coordination_needed'] += 1
+            coord_stats['coordination_needed'] += 1
         else:
-            stats['self_symlinks'] += 1
-    
-    return stats
-
-def get_top_consumers(releases: List[ReleaseInfo], limit: int = 10) -> List:
-    """Get top N space consumers"""
-    # Group by unit and owner
-    consumer_map = {}
-    
-    for release in releases:
-        key = (release.unit, release.owner)
-        if key not in consumer_map:
-            consumer_map[key] = {
-                'unit': release.unit,
-                'owner': release.owner,
-                'chiplet': release.chiplet,
+            coord_stats['self_symlinks'] += 1
+        
+        # Size breakdown by chiplet and by (chiplet, unit)
+        totals = chiplet_data.get(chiplet)
+        if totals is None:
+            totals = chiplet_data[chiplet] = {'size_bytes': 0, 'count': 0}
+        totals['size_bytes'] += size_bytes
+        totals['count'] += 1
+        
+        totals = unit_data.get((chiplet, unit))
+        if totals is None:
+            totals = unit_data[(chiplet, unit)] = {'size_bytes': 0, 'count': 0}
+        totals['size_bytes'] += size_bytes
+        totals['count'] += 1
+        
+        # Space consumers by (unit, owner)
+        consumer = consumer_map.get((unit, owner))
+        if consumer is None:
+            consumer = consumer_map[(unit, owner)] = {
+                'unit': unit,
+                'owner': owner,
+                'chiplet': chiplet,
                 'count': 0,
                 'size_bytes': 0
             }
-        consumer_map[key]['count'] += 1
-        consumer_map[key]['size_bytes'] += release.size_bytes
-    
-    # Sort by size and return top N
-    sorted_consumers = sorted(consumer_map.values(), key=lambda x: x['size_bytes'], reverse=True)
-    return sorted_consumers[:limit]
-
-def group_by_chiplet_detailed(releases: List[ReleaseInfo]) -> Dict:
-    """Group releases by chiplet with detailed breakdown"""
-    chiplet_groups = {}
-    
-    for release in releases:
-        if release.chiplet not in chiplet_groups:
-            chiplet_groups[release.chiplet] = []
-        chiplet_groups[release.chiplet].append(release)
-    
-    return chiplet_groups
-
-def group_by_owner_detailed(releases: List[ReleaseInfo]) -> Dict:
-    """Group releases by owner across all chiplets"""
-    owner_groups = {}
-    
-    for release in releases:
-        owner = release.owner
-        if owner not in owner_groups:
-            owner_groups[owner] = {
+        consumer['count'] += 1
+        consumer['size_bytes'] += size_bytes
+        
+        # Releases by owner across all chiplets
+        owner_data = owner_groups.get(owner)
+        if owner_data is None:
+            owner_data = owner_groups[owner] = {
                 'releases': [],
-                'units': set(),
-                'chiplets': set(),
+                'units': [],
+                'chiplets': [],
                 'total_size': 0
             }
-        
-        owner_groups[owner]['releases'].append(release)
-        owner_groups[owner]['units'].add(release.unit)
-        owner_groups[owner]['chiplets'].add(release.chiplet)
-        owner_groups[owner]['total_size'] += release.size_bytes
+        owner_data['releases'].append(release)
+        owner_data['total_size'] += size_bytes
+    
+    # Owner unit/chiplet labels come from the (unit, owner) pairs: one sort over
+    # the pairs instead of set updates per release and a sort per owner
+    for key in sorted(consumer_map):
+        owner_data = owner_groups[key[1]]
+        owner_data['units'].append(key[0])
+        chiplet = consumer_map[key]['chiplet']
+        if chiplet not in owner_data['chiplets']:
+            owner_data['chiplets'].append(chiplet)
+    for owner_data in owner_groups.values():
+        owner_data['chiplets'].sort()
+    
+    # Keep top N by size (partial heap selection - no full sort of every pair)
+    top_consumers = heapq.nlargest(top_limit, consumer_map.values(), key=itemgetter('size_bytes'))
     
-    return owner_groups
+    return {
+        'age_distribution': dict(zip(_AGE_BUCKET_LABELS, age_counts)),
+        'chiplet_breakdown': chiplet_data,
+        'unit_breakdown': unit_data,
+        'coordination': coord_stats,
+        'top_consumers': top_consumers,
+        'unit_owner_summary': consumer_map,
+        'owner_groups': owner_groups
+    }
 
 def enrich_releases_with_symlinks(releases: List[ReleaseInfo]) -> List[ReleaseInfo]:
     """
@@ -2581,42 +1975,44 @@ def enrich_releases_with_symlinks(releases: List[ReleaseInfo]) -> List[ReleaseIn
     # Group releases by unit
     units = {}
     for release in releases:
-        if release.unit not in units:
-            units[release.unit] = []
-        units[release.unit].append(release)
+        units.setdefault(release.unit, []).append(release)
+    
+    # Debug trace is per release - only format it when DEBUG is actually on
+    debug = logger.isEnabledFor(logging.DEBUG)
     
     # Analyze symlinks per unit
-    for unit in units:
-        logger.debug(f"Analyzing symlinks in {unit}...")
+    for unit, unit_releases in units.items():
+        if debug:
+            logger.debug(f"Analyzing symlinks in {unit}...")
         symlink_map = analyze_unit_symlinks(unit)
         
-        logger.debug(f"  [DEBUG] Symlink map for {unit} has {len(symlink_map)} entries")
-        logger.debug(f"  [DEBUG] Symlink map keys: {list(symlink_map.keys())[:3]}...")  # Show first 3
+        if debug:
+            logger.debug(f"  [DEBUG] Symlink map for {unit} has {len(symlink_map)} entries")
+            logger.debug(f"  [DEBUG] Symlink map keys: {list(islice(symlink_map, 3))}...")  # Show first 3
         
-        # Enrich releases with symlink info
-        for release in units[unit]:
-            logger.debug(f"  [DEBUG] Checking release: {release.release_dir}")
-            logger.debug(f"    full_path: {release.full_path}")
-            logger.debug(f"    In symlink_map? {release.full_path in symlink_map}")
+        # Enrich releases with symlink info (one dict lookup per release)
+        for release in unit_releases:
+            symlinks = symlink_map.get(release.full_path)
+            if debug:
+                logger.debug(f"  [DEBUG] Checking release: {release.release_dir}")
+                logger.debug(f"    full_path: {release.full_path}")
+                logger.debug(f"    In symlink_map? {symlinks is not None}")
             
-            if release.full_path in symlink_map:
-                symlinks = symlink_map[release.full_path]
+            if symlinks is not None:
                 release.has_symlinks = True
                 release.symlink_infos = symlinks
                 release.is_protected = True
                 
-                logger.debug(f"    ✓ MATCHED! Found {len(symlinks)} symlink(s)")
-                
                 # Check if coordination is required (symlinks created by other users)
                 release_owner = release.owner
-                for symlink in symlinks:
-                    if symlink.symlink_owner != release_owner and symlink.symlink_owner != 'unknown':
-                        release.requires_coordination = True
-                        break
+                if any(s.symlink_owner != release_owner and s.symlink_owner != 'unknown' for s in symlinks):
+                    release.requires_coordination = True
                 
-                logger.debug(f"  {release.release_dir}: {len(symlinks)} symlink(s), " +
-                           f"coordination={'required' if release.requires_coordination else 'not needed'}")
-            else:
+                if debug:
+                    logger.debug(f"    ✓ MATCHED! Found {len(symlinks)} symlink(s)")
+                    logger.debug(f"  {release.release_dir}: {len(symlinks)} symlink(s), " +
+                               f"coordination={'required' if release.requires_coordination else 'not needed'}")
+            elif debug:
                 logger.debug(f"    ✗ NO MATCH - Release not found in symlink map")
     
     # Count results
@@ -2629,104 +2025,354 @@ def enrich_releases_with_symlinks(releases: List[ReleaseInfo]) -> List[ReleaseIn
     return releases
 
 def scan_all_releases(units: Dict[str, Dict], age_threshold_days: int, 
-                      specific_units: Optional[List[str]] = None) -> List[ReleaseInfo]:
+                      specific_units: Optional[List[str]] = None,
+                      max_workers: int = DEFAULT_PARALLEL_PROCESSES) -> List[ReleaseInfo]:
     """
     Scan all units for old releases.
     
+    Units are independent directories, so they are scanned in parallel.
+    
     Args:
         units: Dict of unit info from AGUR_UNITS_TABLE.csv
         age_threshold_days: Age threshold in days
         specific_units: Optional list of specific units to scan
+        max_workers: Number of units scanned in parallel
         
     Returns:
         List of all old ReleaseInfo objects
     """
     all_releases = []
+    # Listings kept by an earlier scan are stale (and units without old
+    # releases never have theirs popped by analyze_unit_symlinks)
+    _unit_symlink_entries.clear()
     
     units_to_scan = specific_units if specific_units else list(units.keys())
     
     logger.info(f"\nScanning {len(units_to_scan)} units for releases older than {age_threshold_days} days...")
     
+    known_units = []
     for unit in units_to_scan:
         if unit not in units:
             logger.warning(f"Unit {unit} not found in units table, skipping")
             continue
-        
-        unit_releases = scan_unit_releases(unit, units[unit], age_threshold_days)
-        all_releases.extend(unit_releases)
+        known_units.append(unit)
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # map() keeps unit order, so the release list is deterministic
+        for unit_releases in executor.map(
+                lambda unit: scan_unit_releases(unit, units[unit], age_threshold_days),
+                known_units):
+            all_releases.extend(unit_releases)
     
     logger.info(f"Found {len(all_releases)} old releases across {len(units_to_scan)} units")
     
     return all_releases
 
+# Worker threads for the approval server when served by waitress
+APPROVAL_SERVER_THREADS = 8
+
 # Global variable to store releases for the approval server
 _approval_server_releases = []
 _approval_server_output_dir = None
 _approval_server_test_mode = False
+# Approved-ID set -> (approved releases, owner recommendations), most recent last
+_OWNER_GROUPING_CACHE_SIZE = 8
+_owner_grouping_lock = Lock()
+_owner_grouping_cache: 'OrderedDict[FrozenSet[str], Tuple[List[ReleaseInfo], Dict[str, OwnerRecommendation]]]' = OrderedDict()
+
+# Newest approval state file (re-globbed at most every _STATE_GLOB_TTL seconds) and
+# the parsed state last read from / written to it, keyed by (mtime_ns, size)
+_STATE_GLOB_TTL = 1.0
+# Approval toggles are appended to approval_state_<session>.jsonl and folded into
+# a full JSON snapshot once this many have accumulated
+APPROVAL_SNAPSHOT_EVERY = 100
+_approval_log_lines: Dict[Path, int] = {}
+# Serializes approval state read-modify-write cycles across Flask worker threads
+_STATE_LOCK = RLock()
+_STATE_CACHE = {'dir': None, 'newest': None, 'listed_at': float('-inf'),
+                'path': None, 'stamp': None, 'state': None}
+
+def _newest_state_file(output_dir: Path) -> Optional[Path]:
+    """Newest approval_state_*.json in output_dir - polls within the TTL share one glob"""
+    now = time.monotonic()
+    if _STATE_CACHE['dir'] != output_dir or now - _STATE_CACHE['listed_at'] > _STATE_GLOB_TTL:
+        state_files = sorted(output_dir.glob('approval_state_*.json'), reverse=True)
+        _STATE_CACHE.update(dir=output_dir, newest=state_files[0] if state_files else None, listed_at=now)
+    return _STATE_CACHE['newest']
+
+def _file_stamp(path: Path) -> Optional[Tuple[int, int]]:
+    """(mtime_ns, size) of path, or None if it is gone"""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+def _approval_log_path(state_file: Path) -> Path:
+    """Toggle log that sits next to a snapshot (approval_state_<session>.jsonl)"""
+    return state_file.with_suffix('.jsonl')
+
+def _replay_approval_log(state: Dict, log_path: Path) -> int:
+    """
+    Apply logged approval toggles on top of a snapshot
+    
+    Args:
+        state: Snapshot state, updated in place
+        log_path: JSONL toggle log ({"t": time, "rid": release id, "a": approved} per line)
+    
+    Returns:
+        Number of toggles replayed
+    """
+    replayed = 0
+    try:
+        with open(log_path, 'rb') as f:
+            lines = f.readlines()
+    except FileNotFoundError:
+        return 0
+    
+    approvals = state.setdefault('approvals', {})
+    for line in lines:
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            continue  # Torn final line from an interrupted write
+        approval = approvals.setdefault(entry['rid'], {})
+        approval['approved'] = entry['a']
+        approval['approved_by'] = 'browser_session'
+        approval['approved_at'] = entry['t']
+        state['last_updated'] = entry['t']
+        replayed += 1
+    return replayed
 
 def load_approval_state(output_dir: Path) -> Dict:
-    """Load approval state from JSON file"""
-    state_files = sorted(output_dir.glob('approval_state_*.json'), reverse=True)
-    if state_files:
-        with open(state_files[0], 'r') as f:
-            state = json.load(f)
-        
-        # Backward compatibility: Convert old emailed_releases format to new format
-        if 'emailed_releases' in state:
-            for release_id, info in state['emailed_releases'].items():
-                # Old format has 'emailed_at', new format has 'email_history'
-                if 'emailed_at' in info and 'email_history' not in info:
-                    # Convert to new format
-                    info['email_history'] = [{
-                        'sent_at': info['emailed_at'],
-                        'test_mode': info.get('test_mode', False)
-                    }]
-                    # Remove old field
-                    del info['emailed_at']
-                    if 'test_mode' in info:
-                        del info['test_mode']
-        
-        return state
-    
-    # Return empty state if no file exists
-    return {
-        'session_id': datetime.now().strftime('%Y%m%d_%H%M%S'),
-        'created_at': datetime.now().isoformat(),
-        'last_updated': datetime.now().isoformat(),
-        'approvals': {},
-        'emailed_releases': {},  # Track which releases have been emailed
-        'email_sent': False,
-        'email_sent_at': None
-    }
+    """
+    Load approval state from the newest JSON snapshot plus its toggle log
+    
+    The parsed state is cached and only re-read when the snapshot or log
+    changes on disk; callers get their own deep copy to mutate. Runs under
+    _STATE_LOCK so the copy never races record_approvals() patching the cache.
+    """
+    with _STATE_LOCK:
+        state_file = _newest_state_file(output_dir)
+        stamp = _file_stamp(state_file) if state_file is not None else None
+        if state_file is not None and stamp is None:
+            # Listed file vanished since the last glob - look again
+            _STATE_CACHE['listed_at'] = float('-inf')
+            state_file = _newest_state_file(output_dir)
+            stamp = _file_stamp(state_file) if state_file is not None else None
+        
+        if stamp is not None:
+            log_path = _approval_log_path(state_file)
+            stamp = (stamp, _file_stamp(log_path))
+            if state_file == _STATE_CACHE['path'] and stamp == _STATE_CACHE['stamp']:
+                return copy.deepcopy(_STATE_CACHE['state'])
+            
+            if ORJSON_AVAILABLE:
+                with open(state_file, 'rb') as f:
+                    state = orjson.loads(f.read())
+            else:
+                with open(state_file, 'r') as f:
+                    state = json.load(f)
+            
+            # Backward compatibility: Convert old emailed_releases format to new format
+            if 'emailed_releases' in state:
+                for release_id, info in state['emailed_releases'].items():
+                    # Old format has 'emailed_at', new format has 'email_history'
+                    if 'emailed_at' in info and 'email_history' not in info:
+                        # Convert to new format
+                        info['email_history'] = [{
+                            'sent_at': info['emailed_at'],
+                            'test_mode': info.get('test_mode', False)
+                        }]
+                        # Remove old field
+                        del info['emailed_at']
+                        if 'test_mode' in info:
+                            del info['test_mode']
+            
+            _approval_log_lines[log_path] = _replay_approval_log(state, log_path)
+            
+            _STATE_CACHE.update(path=state_file, stamp=stamp, state=state)
+            return copy.deepcopy(state)
+        
+        # Return empty state if no file exists
+        return {
+            'session_id': datetime.now().strftime('%Y%m%d_%H%M%S'),
+            'created_at': datetime.now().isoformat(),
+            'last_updated': datetime.now().isoformat(),
+            'approvals': {},
+            'emailed_releases': {},  # Track which releases have been emailed
+            'email_sent': False,
+            'email_sent_at': None
+        }
 
 def save_approval_state(state: Dict, output_dir: Path):
-    """Save approval state to JSON file"""
-    state['last_updated'] = datetime.now().isoformat()
-    state_file = output_dir / f"approval_state_{state['session_id']}.json"
-    with open(state_file, 'w') as f:
-        json.dump(state, f, indent=2)
-    logger.info(f"  Approval state saved: {state_file}")
+    """Save a full approval state snapshot to JSON file (replaces the toggle log)"""
+    with _STATE_LOCK:
+        state['last_updated'] = datetime.now().isoformat()
+        state_file = output_dir / f"approval_state_{state['session_id']}.json"
+        # Write aside and rename so readers never see a half-written snapshot,
+        tmp_file = state_file.with_name(state_file.name + '.tmp')
+        # and fsync first so a crash cannot leave a renamed but empty file
+        if ORJSON_AVAILABLE:
+            with open(tmp_file, 'wb') as f:
+                f.write(orjson.dumps(state))
+                f.flush()
+                os.fsync(f.fileno())
+        else:
+            with open(tmp_file, 'w', buffering=1 << 20) as f:
+                json.dump(state, f, separators=(',', ':'))
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_file, state_file)
+        
+        # The snapshot now holds every logged toggle
+        log_path = _approval_log_path(state_file)
+        log_path.unlink(missing_ok=True)
+        _approval_log_lines[log_path] = 0
+        
+        # Keep the read cache in step with what is now on disk
+        _STATE_CACHE.update(path=state_file, stamp=(_file_stamp(state_file), None), state=copy.deepcopy(state),
+                            listed_at=float('-inf'))
+        logger.info(f"  Approval state saved: {state_file}")
+
+def record_approvals(state: Dict, output_dir: Path, release_ids: List[str], approved: bool):
+    """
+    Persist approval toggles already applied to state
+    
+    Appends one JSONL line per release to the session's toggle log instead of
+    rewriting the whole state, and folds the log into a full snapshot every
+    APPROVAL_SNAPSHOT_EVERY toggles (or when no snapshot exists yet).
+    
+    Args:
+        state: Approval state with the toggles applied
+        output_dir: Directory holding the approval state files
+        release_ids: Release IDs that were toggled
+        approved: New approval status for those releases
+    """
+    with _STATE_LOCK:
+        state_file = output_dir / f"approval_state_{state['session_id']}.json"
+        log_path = _approval_log_path(state_file)
+        if not state_file.exists() or _approval_log_lines.get(log_path, 0) + len(release_ids) >= APPROVAL_SNAPSHOT_EVERY:
+            save_approval_state(state, output_dir)
+            return
+        
+        timestamp = state['approvals'][release_ids[0]]['approved_at']
+        lines = ''.join([json.dumps({'t': timestamp, 'rid': release_id, 'a': approved}, separators=(',', ':')) + '\n'
+                         for release_id in release_ids])
+        stamp_before = (_file_stamp(state_file), _file_stamp(log_path))
+        with open(log_path, 'a') as f:
+            f.write(lines)
+        _approval_log_lines[log_path] = _approval_log_lines.get(log_path, 0) + len(release_ids)
+        
+        # Patch the toggled entries into an up-to-date read cache rather than
+        # having the next load re-parse the snapshot and replay the log
+        if _STATE_CACHE['path'] == state_file and _STATE_CACHE['stamp'] == stamp_before:
+            cached = _STATE_CACHE['state']
+            for release_id in release_ids:
+                cached['approvals'][release_id] = dict(state['approvals'][release_id])
+            cached['last_updated'] = timestamp
+            _STATE_CACHE['stamp'] = (stamp_before[0], _file_stamp(log_path))
 
 def get_release_id(release: ReleaseInfo) -> str:
-    """Generate unique release ID from release info"""
-    timestamp = release.release_timestamp.strftime('%Y%m%d_%H%M%S')
-    return f"{release.unit}_{timestamp}_{release.owner}"
+    """Unique release ID from release info (formatted once, then cached on the release)"""
+    release_id = release.release_id
+    if not release_id:
+        timestamp = release.release_timestamp.strftime('%Y%m%d_%H%M%S')
+        release_id = release.release_id = f"{release.unit}_{timestamp}_{release.owner}"
+    return release_id
 
 def filter_releases_by_approved(releases: List[ReleaseInfo], approved_ids: Set[str]) -> List[ReleaseInfo]:
     """Filter releases to only include approved ones"""
     return [r for r in releases if get_release_id(r) in approved_ids]
 
-def create_approval_server(releases: List[ReleaseInfo], output_dir: Path, test_mode: bool = False) -> Flask:
+def group_approved_releases(approved_ids: Set[str]) -> Tuple[List[ReleaseInfo], Dict[str, OwnerRecommendation]]:
+    """
+    Approved server releases and their per-owner grouping, memoized by approved-ID set
+    
+    Repeated sends of the same selection reuse the grouping instead of
+    re-filtering and re-grouping every release.
+    
+    Args:
+        approved_ids: Approved release IDs
+        
+    Returns:
+        Tuple of (approved releases, owner_email -> OwnerRecommendation)
+    """
+    key = frozenset(approved_ids)
+    with _owner_grouping_lock:
+        cached = _owner_grouping_cache.get(key)
+        if cached is not None:
+            _owner_grouping_cache.move_to_end(key)
+            logger.info(f"  Reusing owner grouping for {len(key)} approved releases")
+            return cached
+    
+    approved_releases = filter_releases_by_approved(_approval_server_releases, approved_ids)
+    cached = (approved_releases, group_releases_by_owner(approved_releases))
+    with _owner_grouping_lock:
+        _owner_grouping_cache[key] = cached
+        if len(_owner_grouping_cache) > _OWNER_GROUPING_CACHE_SIZE:
+            _owner_grouping_cache.popitem(last=False)
+    return cached
+
+def _json_default(obj):
+    """Serialize the non-JSON types route payloads may carry (paths, sets)"""
+    if isinstance(obj, Path):
+        return str(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def _orjson_json_provider(app: 'Flask'):
+    """
+    Flask JSON provider backed by orjson (only used when orjson is installed)
+    
+    Args:
+        app: Flask application the provider serves
+        
+    Returns:
+        JSONProvider instance to assign to app.json
+    """
+    from flask.json.provider import JSONProvider
+    
+    class OrjsonProvider(JSONProvider):
+        def dumps(self, obj, **kwargs) -> str:
+            return orjson.dumps(obj, default=_json_default, option=orjson.OPT_NON_STR_KEYS).decode()
+        
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+    
+    return OrjsonProvider(app)
+
+def create_approval_server(releases: List[ReleaseInfo], output_dir: Path, test_mode: bool = False) -> 'Flask':
     """Create and configure Flask server for approval management"""
+    from flask import Flask, Response, request, jsonify
+    from flask_cors import CORS
+    
     app = Flask(__name__)
+    if ORJSON_AVAILABLE:
+        app.json = _orjson_json_provider(app)  # jsonify() and request.get_json() via orjson
+    else:
+        # Stdlib provider: no key sorting, never pretty-printed
+        app.json.sort_keys = False
+        app.json.compact = True
     CORS(app)  # Enable CORS for file:// protocol
     
     # Store releases, output dir, and test_mode globally for access in routes
     global _approval_server_releases, _approval_server_output_dir, _approval_server_test_mode
     _approval_server_releases = releases
+    _owner_grouping_cache.clear()
     _approval_server_output_dir = output_dir
     _approval_server_test_mode = test_mode
     
+    def json_response(payload: Dict, status: int = 200) -> 'Response':
+        """Encode payload up front and send it with an explicit Content-Length (keep-alive friendly)"""
+        if ORJSON_AVAILABLE:
+            body = orjson.dumps(payload, default=_json_default)
+        else:
+            body = app.json.dumps(payload).encode()
+        return Response(body, status=status, mimetype='application/json',
+                        headers={'Content-Length': str(len(body))})
+    
     @app.route('/api/releases', methods=['GET'])
     def get_releases():
         """Get all releases with approval status"""
@@ -2773,22 +2419,55 @@ def create_approval_server(releases: List[ReleaseInfo], output_dir: Path, test_m
         if not release_id:
             return jsonify({'success': False, 'error': 'Missing release_id'}), 400
         
-        state = load_approval_state(output_dir)
-        
-        if release_id not in state['approvals']:
-            state['approvals'][release_id] = {}
+        with _STATE_LOCK:
+            state = load_approval_state(output_dir)
+            
+            if release_id not in state['approvals']:
+                state['approvals'][release_id] = {}
+            
+            state['approvals'][release_id]['approved'] = approved
+            state['approvals'][release_id]['approved_by'] = 'browser_session'
+            state['approvals'][release_id]['approved_at'] = datetime.now().isoformat()
+            
+            record_approvals(state, output_dir, [release_id], approved)
+            
+            approved_count = sum(1 for a in state['approvals'].values() if a.get('approved', False))
         
-        state['approvals'][release_id]['approved'] = approved
-        state['approvals'][release_id]['approved_by'] = 'browser_session'
-        state['approvals'][release_id]['approved_at'] = datetime.now().isoformat()
+        return jsonify({
+            'success': True,
+            'approved': approved,
+            'approved_count': approved_count
+        })
+    
+    @app.route('/api/approve_bulk', methods=['POST'])
+    def toggle_approval_bulk():
+        """Set approval status for a batch of releases (one state load/save)"""
+        data = request.get_json()
+        release_ids = data.get('ids') or []
+        approved = data.get('approved', False)
         
-        save_approval_state(state, output_dir)
+        if not release_ids:
+            return jsonify({'success': False, 'error': 'Missing ids'}), 400
         
-        approved_count = sum(1 for a in state['approvals'].values() if a.get('approved', False))
+        with _STATE_LOCK:
+            state = load_approval_state(output_dir)
+            approvals = state['approvals']
+            approved_at = datetime.now().isoformat()
+            
+            for release_id in release_ids:
+                approval = approvals.setdefault(release_id, {})
+                approval['approved'] = approved
+                approval['approved_by'] = 'browser_session'
+                approval['approved_at'] = approved_at
+            
+            record_approvals(state, output_dir, release_ids, approved)
+            
+            approved_count = sum(1 for a in approvals.values() if a.get('approved', False))
         
         return jsonify({
             'success': True,
             'approved': approved,
+            'updated_count': len(release_ids),
             'approved_count': approved_count
         })
     
@@ -2835,10 +2514,10 @@ def create_approval_server(releases: List[ReleaseInfo], output_dir: Path, test_m
                            if info.get('approved', False)}
             
             if not approved_ids:
-                return jsonify({
+                return json_response({
                     'success': False,
                     'error': 'No releases approved for email sending'
-                }), 400
+                }, 400)
             
             # Allow resending - send to ALL approved releases
             # Calculate resend statistics for logging
@@ -2851,41 +2530,45 @@ def create_approval_server(releases: List[ReleaseInfo], output_dir: Path, test_m
             logger.info(f"  New releases: {new_count}")
             logger.info(f"  Resending to: {resend_count}")
             
-            # Send to ALL approved releases (no filtering)
-            approved_releases = filter_releases_by_approved(_approval_server_releases, approved_ids)
-            
-            # Group by owner
-            owner_recommendations = group_releases_by_owner(approved_releases)
+            # Send to ALL approved releases (no filtering), grouped by owner
+            approved_releases, owner_recommendations = group_approved_releases(approved_ids)
             
             # Send emails
             send_cleanup_emails(owner_recommendations, test_mode, approved_releases_set=approved_ids)
             
-            # Update email history for each release
+            # Record the sends against the latest state - approvals may have been
+            # toggled while the emails were going out
             timestamp = datetime.now().isoformat()
-            for release_id in approved_ids:
-                # Find the release to get owner info
-                release = next((r for r in approved_releases if get_release_id(r) == release_id), None)
-                if release:
-                    # Initialize release entry if it doesn't exist
-                    if release_id not in state['emailed_releases']:
-                        state['emailed_releases'][release_id] = {
-                            'owner': release.owner,
-                            'unit': release.unit,
-                            'email_history': []
-                        }
-                    
-                    # Append to email history
-                    state['emailed_releases'][release_id]['email_history'].append({
-                        'sent_at': timestamp,
-                        'test_mode': test_mode
-                    })
-            
-            # Mark overall email_sent flag
-            state['email_sent'] = True
-            state['email_sent_at'] = timestamp
-            save_approval_state(state, output_dir)
+            with _STATE_LOCK:
+                state = load_approval_state(output_dir)
+                state.setdefault('emailed_releases', {})
+                
+                # Update email history for each release
+                releases_by_id = {get_release_id(r): r for r in approved_releases}
+                for release_id in approved_ids:
+                    # Find the release to get owner info
+                    release = releases_by_id.get(release_id)
+                    if release:
+                        # Initialize release entry if it doesn't exist
+                        if release_id not in state['emailed_releases']:
+                            state['emailed_releases'][release_id] = {
+                                'owner': release.owner,
+                                'unit': release.unit,
+                                'email_history': []
+                            }
+                        
+                        # Append to email history
+                        state['emailed_releases'][release_id]['email_history'].append({
+                            'sent_at': timestamp,
+                            'test_mode': test_mode
+                        })
+                
+                # Mark overall email_sent flag
+                state['email_sent'] = True
+                state['email_sent_at'] = timestamp
+                save_approval_state(state, output_dir)
             
-            return jsonify({
+            return json_response({
                 'success': True,
                 'message': f'Emails sent for {len(approved_ids)} releases',
                 'total_sent': len(approved_ids),
@@ -2899,10 +2582,10 @@ def create_approval_server(releases: List[ReleaseInfo], output_dir: Path, test_m
             logger.error(f"Error sending emails: {e}")
             import traceback
             traceback.print_exc()
-            return jsonify({
+            return json_response({
                 'success': False,
                 'error': str(e)
-            }), 500
+            }, 500)
     
     return app
 
@@ -2915,14 +2598,35 @@ def run_approval_server(releases: List[ReleaseInfo], output_dir: Path, test_mode
         logger.info(f"Test mode: ENABLED (emails to {test_recipient} only)")
     else:
         logger.info("Test mode: DISABLED (emails to actual owners)")
-    app.run(host='127.0.0.1', port=port, debug=False, use_reloader=False)
+    # Threaded: approval clicks are served while a long email send is in flight
+    # (state loads and updates, including the shared read cache, all run under
+    # _STATE_LOCK - see test_approval_state.py). Use waitress's worker pool
+    # when installed, otherwise the threaded Werkzeug server.
+    try:
+        from waitress import serve
+    except ImportError:
+        app.run(host='127.0.0.1', port=port, debug=False, use_reloader=False, threaded=True)
+    else:
+        serve(app, host='127.0.0.1', port=port, threads=APPROVAL_SERVER_THREADS)
+
+@functools.lru_cache(maxsize=8)
+def _latest_dashboard_cached(output_dir: str, mtime_ns: int) -> Optional[Path]:
+    """Scan output_dir for the newest dashboard (mtime_ns keys the cache)"""
+    latest = max(Path(output_dir).glob('cleanup_unit_summary_*.html'),
+                 key=lambda p: p.stat().st_mtime_ns, default=None)
+    return latest.absolute() if latest else None
 
 def get_latest_dashboard(output_dir: Path) -> Path:
-    """Get the most recently generated dashboard file"""
-    dashboard_files = sorted(output_dir.glob('cleanup_unit_summary_*.html'), reverse=True)
-    if dashboard_files:
-        return dashboard_files[0].absolute()
-    return None
+    """Get the most recently generated dashboard file
+    
+    The directory scan is memoized on the directory's mtime, which changes
+    whenever a dashboard is added or removed.
+    """
+    try:
+        mtime_ns = output_dir.stat().st_mtime_ns
+    except OSError:
+        return None
+    return _latest_dashboard_cached(str(output_dir), mtime_ns)
 
 def main():
     """Main entry point"""
@@ -2986,7 +2690,7 @@ def main():
         logger.info(f"Scanning specific units: {', '.join(specific_units)}")
     
     # Scan for old releases
-    old_releases = scan_all_releases(units, args.age_threshold, specific_units)
+    old_releases = scan_all_releases(units, args.age_threshold, specific_units, args.parallel)
     
     if not old_releases:
         logger.info("\n✓ No old releases found!")
@@ -2997,11 +2701,10 @@ def main():
     # Analyze symlinks
     old_releases = enrich_releases_with_symlinks(old_releases)
     
-    # Extract owner info from logs
-    old_releases = enrich_releases_with_log_data(old_releases)
-    
-    # Calculate disk usage
-    old_releases = calculate_sizes_parallel(old_releases, args.parallel)
+    # Calculate disk usage and extract owner info from logs in one pass
+    # (log owners are only CC'd, so dry runs skip them)
+    old_releases = enrich_releases_parallel(old_releases, args.parallel,
+                                            want_log_owner=not args.dry_run)
     
     # Group by owner
     owner_recommendations = group_releases_by_owner(old_releases)
@@ -3059,10 +2762,10 @@ def main():
         logger.info("  4. Press Ctrl+C to stop the server")
         logger.info("=" * 80)
         
-        # Keep server running
+        # Keep server running (block in the kernel until Ctrl+C, no periodic wakeups)
+        stop = Event()
         try:
-            while True:
-                time.sleep(1)
+            stop.wait()
         except KeyboardInterrupt:
             logger.info("\n\nServer stopped by user")
             logger.info("Approval state saved. You can resume later by running with --interactive again.")
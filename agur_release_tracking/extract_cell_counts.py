@@ -17,13 +17,27 @@ Date: January 4, 2026
 """
 
 import os
+import sys
 import csv
 import re
-import subprocess
+import time
+import fnmatch
+import math
+import mmap
+import struct
+from operator import itemgetter
 from typing import Dict, List, Tuple, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 
+# Optional: ISA-L inflate is ~3x faster than zlib on large netlists
+try:
+    from isal import igzip as gzip_module
+    ISAL_AVAILABLE = True
+except ImportError:
+    import gzip as gzip_module
+    ISAL_AVAILABLE = False
+
 # Color codes for terminal output
 class Color:
     GREEN = '\033[92m'
@@ -35,6 +49,205 @@ class Color:
     BOLD = '\033[1m'
     END = '\033[0m'
 
+# Progress-line colors, looked up once instead of per line
+_GREEN = Color.GREEN
+_RED = Color.RED
+_END = Color.END
+PROGRESS_FLUSH_EVERY = 20
+
+# Netlists larger than this (compressed) get a sampled estimate instead of a full count
+ESTIMATE_MIN_GZ_BYTES = 200 << 20
+ESTIMATE_SAMPLE_BYTES = 50 << 20
+# How far the sample's compression ratio may be off before the ISIZE wrap count
+# is considered ambiguous (the exact count is used then)
+ESTIMATE_RATIO_TOLERANCE = 1.25
+
+
+# Workarea file searches (compiled once from the find -name / -path globs they replace)
+def _glob_re(*patterns: str) -> 're.Pattern':
+    return re.compile('|'.join(fnmatch.translate(p) for p in patterns))
+
+_NETLIST_NAME_RE = _glob_re('*.nopower.gv.gz', '*.gv.gz')
+_NETLIST_PATH_RE = _glob_re('*/export/*')
+_INNOVUS_LOG_NAME_RE = _glob_re('innovus.logv', 'innovus.log', '*.logv')
+
+# Cell count lines in innovus logs
+_CELL_RE = re.compile(rb'(?:Total number of instances|Total instances|Number of instances|Cell count|Total cells):\s+(\d+)',
+                      re.IGNORECASE)
+
+
+def _find_files(root: str, name_re: 're.Pattern', path_re: Optional['re.Pattern'] = None,
+                maxdepth: int = 10, limit: int = 5, timeout: Optional[float] = None) -> List[str]:
+    """Find regular files under root, like `find root -maxdepth N -type f -name ... | head -N`
+    
+    Walks with os.scandir (no shell, symlinks not followed) and stops at the
+    first `limit` matches.
+    
+    Args:
+        root: Directory to search
+        name_re: Compiled pattern the file name must match
+        path_re: Optional compiled pattern the full file path must match (find -path)
+        maxdepth: Maximum depth below root, as in find -maxdepth
+        limit: Stop after this many matches
+        timeout: Stop walking after this many seconds (None = no limit)
+    
+    Returns:
+        Matching file paths in walk order
+    """
+    matches = []
+    deadline = time.monotonic() + timeout if timeout else None
+    stack = [(root, 0)]
+    while stack:
+        path, depth = stack.pop()
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if depth + 1 < maxdepth:
+                                stack.append((entry.path, depth + 1))
+                        elif (entry.is_file(follow_symlinks=False) and name_re.match(entry.name)
+                              and (path_re is None or path_re.match(entry.path))):
+                            matches.append(entry.path)
+                            if len(matches) >= limit:
+                                return matches
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+        if deadline is not None and time.monotonic() > deadline:
+            break
+    return matches
+
+
+def _count_lines_stream(f, needle: bytes, deadline: Optional[float] = None,
+                        max_bytes: Optional[int] = None) -> Tuple[int, int, bool]:
+    """Count lines containing needle in a binary stream, reading 1 MiB chunks
+    
+    Only complete lines of each chunk are scanned; the partial last line is
+    carried over to the next chunk.
+    
+    Args:
+        f: Binary file object (e.g. an open gzip stream)
+        needle: Byte string to look for
+        deadline: time.monotonic() value after which TimeoutError is raised
+        max_bytes: Stop after reading about this many bytes (None = read to EOF)
+    
+    Returns:
+        Tuple of (matching lines, bytes read, whether EOF was reached)
+    """
+    line_re = re.compile(re.escape(needle) + rb'[^\n]*')
+    count = 0
+    nread = 0
+    carry = b''
+    while max_bytes is None or nread < max_bytes:
+        buf = f.read(1 << 20)
+        if not buf:
+            if needle in carry:
+                count += 1
+            return count, nread, True
+        nread += len(buf)
+        if carry:
+            buf = carry + buf
+        end = buf.rfind(b'\n') + 1
+        carry = buf[end:]
+        count += sum(1 for _ in line_re.finditer(buf, 0, end))
+        if deadline is not None and time.monotonic() > deadline:
+            raise TimeoutError(f"counting {getattr(f, 'name', f)} exceeded deadline")
+    return count, nread, False
+
+
+def _count_pattern_gz(path: str, needle: bytes = b' (', timeout: Optional[float] = None) -> int:
+    """Count lines of a gzipped file containing needle, like `zcat path | grep -c needle`
+    
+    Args:
+        path: Path to the .gz file
+        needle: Byte string to look for
+        timeout: Raise TimeoutError after this many seconds (None = no limit)
+    
+    Returns:
+        Number of matching lines
+    """
+    deadline = time.monotonic() + timeout if timeout else None
+    with gzip_module.open(path, 'rb') as f:
+        count, _, _ = _count_lines_stream(f, needle, deadline)
+    return count
+
+
+def _estimate_cells_gz(path: str, needle: bytes = b' (', sample_bytes: int = ESTIMATE_SAMPLE_BYTES,
+                       timeout: Optional[float] = None) -> Optional[Tuple[int, bool]]:
+    """Estimate the matching-line count of a large gzipped netlist from a sample
+    
+    Counts matches in the first sample_bytes of decompressed data and scales
+    by the uncompressed size from the gzip trailer (ISIZE). Good enough for
+    ranking, not an exact count.
+    
+    ISIZE is only stored mod 2^32, so the real size is one of isize + k * 4 GiB.
+    The candidate is picked with the size implied by the sample's compression
+    ratio, and is only trusted when exactly one candidate lies within a factor
+    of ESTIMATE_RATIO_TOLERANCE of it. Otherwise the wrap count is ambiguous
+    (from roughly 9 GiB uncompressed up, two candidates can share the window)
+    and None is returned so the caller can count exactly. An accepted estimate
+    is therefore only wrong by a whole wrap if the file's overall compression
+    ratio differs from the sample's by more than that factor.
+    
+    Args:
+        path: Path to the .gz file
+        needle: Byte string to look for
+        sample_bytes: Decompressed bytes to sample
+        timeout: Raise TimeoutError after this many seconds (None = no limit)
+    
+    Returns:
+        Tuple of (number of matching lines, whether it is an estimate - False
+        if the sample reached EOF and the count is exact), or None if the
+        uncompressed size is ambiguous
+    """
+    deadline = time.monotonic() + timeout if timeout else None
+    with open(path, 'rb') as raw:
+        raw.seek(-4, os.SEEK_END)
+        isize = struct.unpack('<I', raw.read(4))[0]
+        compressed_size = raw.tell()
+        raw.seek(0)
+        with gzip_module.open(raw, 'rb') as f:
+            count, nread, eof = _count_lines_stream(f, needle, deadline, sample_bytes)
+        consumed = raw.tell()
+    
+    if eof or not nread:
+        return count, False
+    
+    approx_total = compressed_size * nread / max(consumed, 1)
+    low = max(approx_total / ESTIMATE_RATIO_TOLERANCE, nread)
+    high = approx_total * ESTIMATE_RATIO_TOLERANCE
+    first_wrap = max(math.ceil((low - isize) / (1 << 32)), 0)
+    candidates = [isize + wraps * (1 << 32)
+                  for wraps in range(first_wrap, first_wrap + 2)
+                  if isize + wraps * (1 << 32) <= high]
+    if len(candidates) != 1:
+        return None
+    return int(count * candidates[0] / nread), True
+
+
+def _scan_log(path: str) -> Optional[int]:
+    """Return the last cell count reported in a log file
+    
+    The log is memory-mapped and searched with _CELL_RE directly, so nothing
+    is copied into Python except the matched number.
+    
+    Args:
+        path: Path to the log file
+    
+    Returns:
+        Cell count from the last matching line, or None if there is none
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            last = None
+            for last in _CELL_RE.finditer(mm):
+                pass
+            return int(last.group(1)) if last else None
+
 
 def extract_cell_count_from_workarea(unit: str, workarea_path: str, chiplet: str) -> Optional[Dict]:
     """Extract cell count from a unit's workarea
@@ -50,111 +263,79 @@ def extract_cell_count_from_workarea(unit: str, workarea_path: str, chiplet: str
         chiplet: Chiplet name
     
     Returns:
-        Dict with unit info and cell count, or None if not found
+        Dict with unit info and cell count ('estimated' is True when the count was
+        extrapolated from a sample of a very large netlist), or None if not found
     """
     cell_count = None
     source_file = None
+    estimated = False
     
-    # Check if workarea exists
-    if not os.path.exists(workarea_path):
+    # Check if workarea exists and is non-empty (one-entry probe fails fast on
+    # deleted workareas instead of spending the search timeouts on them)
+    try:
+        if not os.path.isdir(workarea_path):
+            return None
+        with os.scandir(workarea_path) as entries:
+            next(entries)
+    except (OSError, StopIteration):
         return None
     
     # Strategy 1: Extract from netlist files (most accurate!)
     # Look for *.nopower.gv.gz or *.gv.gz files in export/export_innovus directories
     try:
         # Find netlist files (gv.gz files)
-        find_cmd = f"find {workarea_path} -maxdepth 10 -type f \\( -name '*.nopower.gv.gz' -o -name '*.gv.gz' \\) -path '*/export/*' 2>/dev/null | head -5"
-        result = subprocess.run(find_cmd, shell=True,
-                               stdout=subprocess.PIPE,
-                               stderr=subprocess.PIPE,
-                               universal_newlines=True,
-                               timeout=15)
+        netlist_files = _find_files(workarea_path, _NETLIST_NAME_RE, _NETLIST_PATH_RE,
+                                    limit=5, timeout=15)
         
-        if result.returncode == 0 and result.stdout.strip():
-            netlist_files = result.stdout.strip().split('\n')
-            
+        if netlist_files:
             # Try each netlist file
+            # (paths come straight from the walk, so no separate exists() probe)
             for netlist_file in netlist_files:
-                if not os.path.exists(netlist_file):
-                    continue
-                
                 try:
                     # Count cell instantiations in netlist
                     # Cell instances appear as lines with " (" pattern (module instantiation)
                     # e.g., "  NAND2_X1 U1234 ("
-                    count_cmd = f"zcat {netlist_file} 2>/dev/null | grep -c ' ('"
-                    count_result = subprocess.run(count_cmd, shell=True,
-                                                 stdout=subprocess.PIPE,
-                                                 stderr=subprocess.PIPE,
-                                                 universal_newlines=True,
-                                                 timeout=30)
+                    counted = None
+                    if os.path.getsize(netlist_file) > ESTIMATE_MIN_GZ_BYTES:
+                        counted = _estimate_cells_gz(netlist_file, b' (', timeout=30)
+                    if counted is None:
+                        counted = _count_pattern_gz(netlist_file, b' (', timeout=30), False
+                    count, is_estimate = counted
                     
-                    if count_result.returncode == 0 and count_result.stdout.strip():
-                        count = int(count_result.stdout.strip())
-                        # Sanity check: cell count should be reasonable (> 100)
-                        if count > 100:
-                            cell_count = count
-                            source_file = netlist_file
-                            break
+                    # Sanity check: cell count should be reasonable (> 100)
+                    if count > 100:
+                        cell_count = count
+                        source_file = netlist_file
+                        estimated = is_estimate
+                        break
                 
-                except (subprocess.TimeoutExpired, ValueError, Exception):
+                except (TimeoutError, OSError, EOFError, Exception):
                     continue
         
-    except (subprocess.TimeoutExpired, Exception):
+    except Exception:
         pass
     
     # Strategy 2: Look for innovus log files (backup method)
     if not cell_count:
-        cell_count_patterns = [
-            r'Total number of instances:\s+(\d+)',
-            r'Total instances:\s+(\d+)',
-            r'Number of instances:\s+(\d+)',
-            r'Cell count:\s+(\d+)',
-            r'Total cells:\s+(\d+)',
-        ]
-        
         try:
             # Search for innovus log files
-            find_cmd = f"find {workarea_path} -maxdepth 10 -type f \\( -name 'innovus.logv' -o -name 'innovus.log' -o -name '*.logv' \\) 2>/dev/null | head -20"
-            result = subprocess.run(find_cmd, shell=True,
-                                   stdout=subprocess.PIPE,
-                                   stderr=subprocess.PIPE,
-                                   universal_newlines=True,
-                                   timeout=10)
+            log_files = _find_files(workarea_path, _INNOVUS_LOG_NAME_RE, limit=20, timeout=10)
             
-            if result.returncode == 0 and result.stdout.strip():
-                log_files = result.stdout.strip().split('\n')
-                
+            if log_files:
                 # Search each log file for cell count
                 for log_file in log_files:
-                    if not os.path.exists(log_file):
-                        continue
-                    
                     try:
-                        # Use grep for fast searching
-                        grep_cmd = f"grep -i -E 'Total number of instances|Total instances|Cell count|Total cells' {log_file} | tail -5"
-                        grep_result = subprocess.run(grep_cmd, shell=True,
-                                                    stdout=subprocess.PIPE,
-                                                    stderr=subprocess.PIPE,
-                                                    universal_newlines=True,
-                                                    timeout=5)
-                        
-                        if grep_result.returncode == 0 and grep_result.stdout.strip():
-                            # Try each pattern
-                            for pattern in cell_count_patterns:
-                                match = re.search(pattern, grep_result.stdout, re.IGNORECASE)
-                                if match:
-                                    cell_count = int(match.group(1))
-                                    source_file = log_file
-                                    break
-                            
-                            if cell_count:
-                                break
+                        # Latest reported count wins (logs append per run)
+                        count = _scan_log(log_file)
+                        if count:
+                            cell_count = count
+                            source_file = log_file
+                            break
                     
-                    except (subprocess.TimeoutExpired, Exception):
+                    except (OSError, ValueError, Exception):
                         continue
         
-        except (subprocess.TimeoutExpired, Exception):
+        except Exception:
             pass
     
     # Return result
@@ -164,7 +345,8 @@ def extract_cell_count_from_workarea(unit: str, workarea_path: str, chiplet: str
             'chiplet': chiplet,
             'cell_count': cell_count,
             'workarea_path': workarea_path,
-            'source_file': source_file
+            'source_file': source_file,
+            'estimated': estimated
         }
     
     return None
@@ -176,18 +358,24 @@ def load_units_from_csv(csv_path: str) -> List[Dict]:
     Returns:
         List of unit dictionaries with unit, chiplet, and workarea_path
     """
-    units = []
+    keys = ('unit', 'chiplet', 'workarea_path', 'release_user', 'release_timestamp')
+    columns = ('UNIT', 'CHIPLET', 'RELEASED_WA_PATH', 'RELEASE_USER', 'RELEASE_TIMESTAMP')
     
-    with open(csv_path, 'r') as f:
-        reader = csv.DictReader(f)
+    with open(csv_path, 'r', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        # Resolve column positions once; rows are plain lists, not dicts
+        indexes = [header.index(c) for c in columns]
+        pick = itemgetter(*indexes)
+        width = max(indexes) + 1
+        
+        units = []
         for row in reader:
-            units.append({
-                'unit': row['UNIT'],
-                'chiplet': row['CHIPLET'],
-                'workarea_path': row['RELEASED_WA_PATH'],
-                'release_user': row['RELEASE_USER'],
-                'release_timestamp': row['RELEASE_TIMESTAMP']
-            })
+            if not row:
+                continue
+            if len(row) < width:
+                row += [None] * (width - len(row))
+            units.append(dict(zip(keys, pick(row))))
     
     return units
 
@@ -214,11 +402,15 @@ def main():
     print(f"{Color.CYAN}This may take a few minutes depending on workarea accessibility...{Color.END}\n")
     
     results = []
+    misses = []
     processed = 0
     found = 0
+    total = len(units)
+    write = sys.stdout.write
     
-    # Use ThreadPoolExecutor for parallel extraction (max 10 concurrent threads)
-    with ThreadPoolExecutor(max_workers=10) as executor:
+    # Use ProcessPoolExecutor for parallel extraction - gzip/regex scanning is CPU-bound
+    # Python, so threads would serialize on the GIL (one worker per core, max 16)
+    with ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, 16)) as executor:
         # Submit all tasks
         future_to_unit = {
             executor.submit(extract_cell_count_from_workarea, 
@@ -226,7 +418,8 @@ def main():
             for u in units
         }
         
-        # Collect results as they complete
+        # Collect results as they complete, on a single in-place progress line;
+        # units without a count are listed once the pool is done
         for future in as_completed(future_to_unit):
             unit_info = future_to_unit[future]
             processed += 1
@@ -236,11 +429,19 @@ def main():
                 if result:
                     found += 1
                     results.append(result)
-                    print(f"{Color.GREEN}[{processed:2d}/{len(units)}] ✓ {result['unit']:15s} - {result['cell_count']:>10,} cells{Color.END}")
                 else:
-                    print(f"{Color.RED}[{processed:2d}/{len(units)}] ✗ {unit_info['unit']:15s} - No cell count found{Color.END}")
+                    misses.append(f"{_RED}✗ {unit_info['unit']:15s} - No cell count found{_END}\n")
             except Exception as e:
-                print(f"{Color.RED}[{processed:2d}/{len(units)}] ✗ {unit_info['unit']:15s} - Error: {e}{Color.END}")
+                misses.append(f"{_RED}✗ {unit_info['unit']:15s} - Error: {e}{_END}\n")
+            
+            write(f"\r[{processed:{len(str(total))}d}/{total}] {_GREEN}✓ {found} found{_END}  {_RED}✗ {processed - found} missing{_END}")
+            # Coalesce progress output into one flush per batch
+            if processed % PROGRESS_FLUSH_EVERY == 0:
+                sys.stdout.flush()
+    
+    write("\n")
+    write(''.join(sorted(misses)))
+    sys.stdout.flush()
     
     print(f"\n{Color.BOLD}{'='*80}{Color.END}")
     print(f"{Color.GREEN}Successfully extracted cell counts for {found}/{len(units)} units{Color.END}")
@@ -255,10 +456,12 @@ def main():
     
     # Write full CSV
     print(f"{Color.YELLOW}Writing full results to CSV: {output_csv}{Color.END}")
+    rows = [(r['unit'], r['chiplet'], r['cell_count'], r['workarea_path'], r['source_file'])
+            for r in results]
     with open(output_csv, 'w', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=['unit', 'chiplet', 'cell_count', 'workarea_path', 'source_file'])
-        writer.writeheader()
-        writer.writerows(results)
+        writer = csv.writer(f)
+        writer.writerow(('unit', 'chiplet', 'cell_count', 'workarea_path', 'source_file'))
+        writer.writerows(rows)
     print(f"{Color.GREEN}✓ CSV written{Color.END}\n")
     
     # Generate top 15 report
@@ -282,7 +485,11 @@ def main():
         
         for idx, result in enumerate(top_15, 1):
             percentage = (result['cell_count'] / max_cell_count) * 100
-            f.write(f"{idx:<6} {result['unit']:<15} {result['chiplet']:<10} {result['cell_count']:>15,} {percentage:>11.1f}%\n")
+            mark = '~' if result['estimated'] else ' '
+            f.write(f"{idx:<6} {result['unit']:<15} {result['chiplet']:<10} {mark}{result['cell_count']:>14,} {percentage:>11.1f}%\n")
+        
+        if any(r['estimated'] for r in top_15):
+            f.write("\n~ = estimated from a sample of a very large netlist\n")
         
         f.write("\n" + "="*80 + "\n\n")
         
@@ -311,7 +518,8 @@ def main():
     for idx, result in enumerate(top_15, 1):
         percentage = (result['cell_count'] / max_cell_count) * 100
         color = Color.GREEN if idx <= 5 else Color.YELLOW if idx <= 10 else Color.CYAN
-        print(f"{color}{idx:<6} {result['unit']:<15} {result['chiplet']:<10} {result['cell_count']:>15,} {percentage:>11.1f}%{Color.END}")
+        mark = '~' if result['estimated'] else ' '
+        print(f"{color}{idx:<6} {result['unit']:<15} {result['chiplet']:<10} {mark}{result['cell_count']:>14,} {percentage:>11.1f}%{Color.END}")
     
     print(f"\n{Color.BOLD}{'='*80}{Color.END}")
     print(f"{Color.GREEN}✓ Complete! Check files:{Color.END}")
@@ -0,0 +1,151 @@
+"""
+Tests for the interactive-approval state files in agur_release_cleanup.py
+
+Covers the JSON snapshot + JSONL toggle log round trip and concurrent
+readers/writers of the cached state (the approval server is multi-threaded).
+
+Run with: python -m pytest test_approval_state.py
+"""
+
+import json
+import logging
+import sys
+from datetime import datetime
+from threading import Thread
+
+import pytest
+
+import agur_release_cleanup as cleanup
+
+
+@pytest.fixture
+def output_dir(tmp_path):
+    """Empty report directory with the module's state caches reset"""
+    cleanup.logger = logging.getLogger('test_approval_state')
+    cleanup._STATE_CACHE.update(dir=None, newest=None, listed_at=float('-inf'),
+                                path=None, stamp=None, state=None)
+    cleanup._approval_log_lines.clear()
+    return tmp_path
+
+
+def toggle(state, output_dir, release_ids, approved):
+    """Apply toggles to state and persist them the way the /api/approve routes do"""
+    timestamp = datetime.now().isoformat()
+    for release_id in release_ids:
+        state['approvals'][release_id] = {
+            'approved': approved,
+            'approved_by': 'browser_session',
+            'approved_at': timestamp
+        }
+    cleanup.record_approvals(state, output_dir, release_ids, approved)
+
+
+def reload_from_disk(output_dir):
+    """Load state bypassing the read cache (as a fresh process would)"""
+    cleanup._STATE_CACHE.update(path=None, stamp=None, state=None, listed_at=float('-inf'))
+    return cleanup.load_approval_state(output_dir)
+
+
+def test_toggle_log_is_replayed_on_load(output_dir):
+    state = cleanup.load_approval_state(output_dir)
+    toggle(state, output_dir, ['u1_20250101_000000_bob'], True)  # first toggle writes the snapshot
+    snapshot = output_dir / f"approval_state_{state['session_id']}.json"
+    log_path = snapshot.with_suffix('.jsonl')
+    assert snapshot.exists() and not log_path.exists()
+
+    toggle(state, output_dir, ['u2_20250101_000000_bob', 'u3_20250101_000000_bob'], True)
+    toggle(state, output_dir, ['u1_20250101_000000_bob'], False)
+
+    # Snapshot is untouched; the toggles live in the log
+    assert len(log_path.read_text().splitlines()) == 3
+    assert json.loads(snapshot.read_text())['approvals']['u1_20250101_000000_bob']['approved'] is True
+
+    loaded = reload_from_disk(output_dir)
+    assert {rid: info['approved'] for rid, info in loaded['approvals'].items()} == {
+        'u1_20250101_000000_bob': False,
+        'u2_20250101_000000_bob': True,
+        'u3_20250101_000000_bob': True,
+    }
+    assert loaded['approvals'] == state['approvals']
+
+
+def test_torn_log_line_is_ignored(output_dir):
+    state = cleanup.load_approval_state(output_dir)
+    toggle(state, output_dir, ['a'], True)
+    toggle(state, output_dir, ['b'], True)
+    log_path = output_dir / f"approval_state_{state['session_id']}.jsonl"
+    with open(log_path, 'a') as f:
+        f.write('{"t":"2026-01-01T00:00:00","ri')  # interrupted append
+
+    loaded = reload_from_disk(output_dir)
+    assert sorted(loaded['approvals']) == ['a', 'b']
+
+
+def test_save_folds_log_into_snapshot(output_dir):
+    state = cleanup.load_approval_state(output_dir)
+    toggle(state, output_dir, ['a'], True)
+    toggle(state, output_dir, ['b'], True)
+    log_path = output_dir / f"approval_state_{state['session_id']}.jsonl"
+    assert log_path.exists()
+
+    cleanup.save_approval_state(state, output_dir)
+    assert not log_path.exists()
+    assert reload_from_disk(output_dir)['approvals'] == state['approvals']
+
+
+def test_log_is_snapshotted_every_n_toggles(output_dir, monkeypatch):
+    monkeypatch.setattr(cleanup, 'APPROVAL_SNAPSHOT_EVERY', 5)
+    state = cleanup.load_approval_state(output_dir)
+    toggle(state, output_dir, ['r0'], True)
+    log_path = output_dir / f"approval_state_{state['session_id']}.jsonl"
+
+    for i in range(1, 5):
+        toggle(state, output_dir, [f'r{i}'], True)
+    assert len(log_path.read_text().splitlines()) == 4
+
+    toggle(state, output_dir, ['r5'], True)  # fifth logged toggle folds the log
+    assert not log_path.exists()
+    assert sorted(reload_from_disk(output_dir)['approvals']) == [f'r{i}' for i in range(6)]
+
+
+def test_concurrent_toggles_and_loads(output_dir, monkeypatch):
+    monkeypatch.setattr(cleanup, 'APPROVAL_SNAPSHOT_EVERY', 10 ** 6)
+    state = cleanup.load_approval_state(output_dir)
+    toggle(state, output_dir, [f'seed{i}' for i in range(2000)], True)
+    errors = []
+    done = []
+
+    def writer():
+        try:
+            for i in range(150):
+                with cleanup._STATE_LOCK:
+                    current = cleanup.load_approval_state(output_dir)
+                    toggle(current, output_dir, [f'w{i}'], True)
+        except Exception as e:
+            errors.append(e)
+        finally:
+            done.append(True)
+
+    def reader():
+        try:
+            while not done:
+                loaded = cleanup.load_approval_state(output_dir)
+                assert all(info['approved'] for info in loaded['approvals'].values())
+        except Exception as e:
+            errors.append(e)
+
+    # A large state and frequent thread switches make copy/patch overlaps likely
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [Thread(target=writer)] + [Thread(target=reader) for _ in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+    assert errors == []
+    loaded = reload_from_disk(output_dir)
+    assert len(loaded['approvals']) == 2150